@@ -1,91 +1,183 @@
 # app/services/ai_resume_generator.py
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
+import asyncio
+import contextlib
+import io
 import os
+import re
+import threading
 from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+from reportlab.platypus import BaseDocTemplate, Frame, PageTemplate, Paragraph, Spacer, Table, TableStyle
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_JUSTIFY
 
+# Contact patterns, each searched on its own so one can never consume text another needs
+_LINKEDIN_RE = re.compile(r'linkedin\.com/(?:in/)?([A-Za-z0-9-]+)')
+_LOCATION_RE = re.compile(r'([A-Za-z\s]+,\s*[A-Za-z]{2})')
+_LOCATION_FALLBACK_RE = re.compile(r'([A-Za-z\s]+,\s*[A-Za-z\s]+)')
+_PORTFOLIO_RE = re.compile(r'https?://(?:www\.)?([A-Za-z0-9.-]+\.[A-Za-z]{2,})')
+
+# First line with any non-blank content, however far down the text it starts
+_NAME_LINE_RE = re.compile(r'\S[^\n]*')
+
+# Output formats built by default; callers may request a subset
+_ALL_FORMATS = frozenset({'pdf', 'text'})
+
+# Output directory for generated resumes, created on first write
+_OUT_DIR = "uploads/optimized"
+_OUT_DIR_READY = False
+_OUT_DIR_LOCK = threading.Lock()
+
+def _ensure_out_dir() -> None:
+    """Create the output directory once per process"""
+    global _OUT_DIR_READY
+    if _OUT_DIR_READY:
+        return
+    with _OUT_DIR_LOCK:
+        if not _OUT_DIR_READY:
+            os.makedirs(_OUT_DIR, exist_ok=True)
+            _OUT_DIR_READY = True
+
+def _write_atomic(file_path: str, data: bytes) -> None:
+    """Write via a temp file beside the target so readers never see a partial PDF"""
+    _ensure_out_dir()
+    tmp = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        # Created 0666 so the kernel applies the umask, giving the mode a plain open() would
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        with open(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, file_path)
+    except BaseException:
+        # Never leave a half-written temp file behind, whichever step failed
+        with contextlib.suppress(OSError):
+            os.remove(tmp)
+        raise
+
+# Letter page geometry for the premium page template
+_MARGIN = 0.75*inch
+_FRAME_WIDTH = letter[0] - 2*_MARGIN
+
+# Page templates are reused across builds; Frames keep a layout cursor while a
+# document is built, so each worker thread gets its own cached template
+_TEMPLATE_CACHE = threading.local()
+
+def _premium_page_template() -> PageTemplate:
+    """Return this thread's cached single-frame letter page template"""
+    template = getattr(_TEMPLATE_CACHE, 'template', None)
+    if template is None:
+        frame = Frame(_MARGIN, _MARGIN, _FRAME_WIDTH, letter[1] - 2*_MARGIN, id='main')
+        template = _TEMPLATE_CACHE.template = PageTemplate(id='resume', frames=[frame], pagesize=letter)
+    return template
+
+# Contact fields and their text-version labels (same output as key.title())
+_CONTACT_LABELS = (
+    ('email', 'Email'),
+    ('phone', 'Phone'),
+    ('linkedin', 'Linkedin'),
+    ('location', 'Location')
+)
+
+# Bullet prefixes, concatenated onto each achievement / experience line
+_EMOJI_TROPHY = "🏆 "
+_EMOJI_BULLET = "• "
+
+# Fixed section underlines for the text version
+_SUMMARY_RULE = '-' * 17
+_ACH_RULE = '-' * 16
+_SKILLS_RULE = '-' * 19
+_EXP_RULE = '-' * 38
+
+def _build_professional_styles():
+    """Build the premium resume stylesheet (shared, built once at import)"""
+    styles = getSampleStyleSheet()
+    
+    # Executive name style
+    styles.add(ParagraphStyle(
+        name='ExecutiveName',
+        parent=styles['Title'],
+        fontSize=22,
+        fontName='Helvetica-Bold',
+        spaceAfter=6,
+        textColor=colors.HexColor('#1a365d'),
+        alignment=TA_CENTER,
+        borderWidth=2,
+        borderColor=colors.HexColor('#3182ce'),
+        borderPadding=8
+    ))
+    
+    # Premium contact style
+    styles.add(ParagraphStyle(
+        name='PremiumContact',
+        parent=styles['Normal'],
+        fontSize=11,
+        fontName='Helvetica',
+        alignment=TA_CENTER,
+        spaceAfter=16,
+        textColor=colors.HexColor('#2d3748')
+    ))
+    
+    # Section header with accent
+    styles.add(ParagraphStyle(
+        name='AccentHeader',
+        parent=styles['Heading2'],
+        fontSize=14,
+        fontName='Helvetica-Bold',
+        spaceBefore=20,
+        spaceAfter=8,
+        textColor=colors.HexColor('#1a365d'),
+        borderWidth=1,
+        borderColor=colors.HexColor('#3182ce'),
+        borderPadding=4,
+        backColor=colors.HexColor('#ebf8ff')
+    ))
+    
+    # AI-optimized summary style
+    styles.add(ParagraphStyle(
+        name='AISummary',
+        parent=styles['Normal'],
+        fontSize=11,
+        fontName='Helvetica',
+        spaceAfter=14,
+        alignment=TA_JUSTIFY,
+        textColor=colors.HexColor('#2d3748'),
+        borderWidth=1,
+        borderColor=colors.HexColor('#e2e8f0'),
+        borderPadding=8
+    ))
+    
+    # Achievement bullet style
+    styles.add(ParagraphStyle(
+        name='Achievement',
+        parent=styles['Normal'],
+        fontSize=10,
+        fontName='Helvetica',
+        spaceAfter=4,
+        leftIndent=20,
+        bulletIndent=10,
+        textColor=colors.HexColor('#2d3748')
+    ))
+    
+    return styles
+
 class AIEnhancedResumeGenerator:
     """
     AI-enhanced resume generator using Perplexity-optimized content
     """
     
-    def __init__(self):
-        self.styles = getSampleStyleSheet()
-        self._setup_professional_styles()
+    # ReportLab styles carry no per-request state, so every instance shares them
+    styles = _build_professional_styles()
     
-    def _setup_professional_styles(self):
-        """Setup premium resume styles"""
-        
-        # Executive name style
-        self.styles.add(ParagraphStyle(
-            name='ExecutiveName',
-            parent=self.styles['Title'],
-            fontSize=22,
-            fontName='Helvetica-Bold',
-            spaceAfter=6,
-            textColor=colors.HexColor('#1a365d'),
-            alignment=TA_CENTER,
-            borderWidth=2,
-            borderColor=colors.HexColor('#3182ce'),
-            borderPadding=8
-        ))
-        
-        # Premium contact style
-        self.styles.add(ParagraphStyle(
-            name='PremiumContact',
-            parent=self.styles['Normal'],
-            fontSize=11,
-            fontName='Helvetica',
-            alignment=TA_CENTER,
-            spaceAfter=16,
-            textColor=colors.HexColor('#2d3748')
-        ))
-        
-        # Section header with accent
-        self.styles.add(ParagraphStyle(
-            name='AccentHeader',
-            parent=self.styles['Heading2'],
-            fontSize=14,
-            fontName='Helvetica-Bold',
-            spaceBefore=20,
-            spaceAfter=8,
-            textColor=colors.HexColor('#1a365d'),
-            borderWidth=1,
-            borderColor=colors.HexColor('#3182ce'),
-            borderPadding=4,
-            backColor=colors.HexColor('#ebf8ff')
-        ))
-        
-        # AI-optimized summary style
-        self.styles.add(ParagraphStyle(
-            name='AISummary',
-            parent=self.styles['Normal'],
-            fontSize=11,
-            fontName='Helvetica',
-            spaceAfter=14,
-            alignment=TA_JUSTIFY,
-            textColor=colors.HexColor('#2d3748'),
-            borderWidth=1,
-            borderColor=colors.HexColor('#e2e8f0'),
-            borderPadding=8
-        ))
-        
-        # Achievement bullet style
-        self.styles.add(ParagraphStyle(
-            name='Achievement',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            fontName='Helvetica',
-            spaceAfter=4,
-            leftIndent=20,
-            bulletIndent=10,
-            textColor=colors.HexColor('#2d3748')
-        ))
+    # Contact fields in display order, with the icon used in the PDF header
+    _CONTACT_FIELDS = (
+        ('email', '📧'),
+        ('phone', '📱'),
+        ('linkedin', '🔗'),
+        ('location', '📍')
+    )
     
     def generate_ai_optimized_resume(
         self, 
@@ -93,149 +185,219 @@ class AIEnhancedResumeGenerator:
         resume_analysis: Dict,
         job_analysis: Dict, 
         perplexity_analysis: Dict,
-        optimized_content: Dict
+        optimized_content: Dict,
+        personal_info: Optional[Dict] = None,
+        formats: frozenset = _ALL_FORMATS,
+        include_bytes: bool = False
     ) -> Dict:
         """Generate premium AI-optimized resume"""
         
         print("🎨 Generating AI-enhanced premium resume...")
         
-        # Extract personal info
-        personal_info = self._extract_enhanced_personal_info(
+        premium_content = self._build_premium_content(
+            original_resume_text, resume_analysis, job_analysis,
+            perplexity_analysis, optimized_content, personal_info
+        )
+        
+        # Generate premium PDF
+        pdf_path = pdf_bytes = None
+        if 'pdf' in formats:
+            pdf_path, pdf_bytes = self._generate_premium_pdf(premium_content, job_analysis)
+        
+        # Generate enhanced text version
+        text_content = None
+        if 'text' in formats:
+            text_content = self._generate_premium_text(premium_content)
+        
+        print(f"✅ AI-enhanced resume generated: {os.path.basename(pdf_path) if pdf_path else 'text version'}")
+        
+        return self._build_result(text_content, pdf_path, pdf_bytes if include_bytes else None)
+    
+    async def generate_ai_optimized_resume_async(
+        self, 
+        original_resume_text: str, 
+        resume_analysis: Dict,
+        job_analysis: Dict, 
+        perplexity_analysis: Dict,
+        optimized_content: Dict,
+        personal_info: Optional[Dict] = None,
+        formats: frozenset = _ALL_FORMATS,
+        include_bytes: bool = False
+    ) -> Dict:
+        """Generate premium AI-optimized resume in a worker thread so the event loop keeps serving requests"""
+        return await asyncio.to_thread(
+            self.generate_ai_optimized_resume,
+            original_resume_text, resume_analysis, job_analysis,
+            perplexity_analysis, optimized_content, personal_info, formats, include_bytes
+        )
+    
+    def _build_premium_content(
+        self, 
+        original_resume_text: str, 
+        resume_analysis: Dict,
+        job_analysis: Dict, 
+        perplexity_analysis: Dict,
+        optimized_content: Dict,
+        personal_info: Optional[Dict] = None
+    ) -> Dict:
+        """Assemble the content shared by the PDF and text versions"""
+        
+        # Extract personal info unless the caller already parsed it
+        personal_info = personal_info or self._extract_enhanced_personal_info(
             original_resume_text, 
             resume_analysis
         )
         
         # Create premium content structure
-        premium_content = {
+        optimized_skills = self._create_premium_skills_section(resume_analysis, job_analysis)
+        return {
             'personal_info': personal_info,
             'ai_summary': optimized_content.get('professional_summary', ''),
             'key_achievements': optimized_content.get('key_achievements', []),
-            'optimized_skills': self._create_premium_skills_section(
-                resume_analysis, job_analysis
-            ),
+            'optimized_skills': optimized_skills,
+            'joined_skills': self._join_skill_lists(optimized_skills),
             'enhanced_experience': optimized_content.get('optimized_experience_bullets', []),
             'perplexity_insights': perplexity_analysis
         }
-        
-        # Generate premium PDF
-        pdf_path = self._generate_premium_pdf(premium_content, job_analysis)
-        
-        # Generate enhanced text version
-        text_content = self._generate_premium_text(premium_content)
-        
-        print(f"✅ AI-enhanced resume generated: {os.path.basename(pdf_path)}")
-        
-        return {
+    
+    def _build_result(self, text_content: Optional[str], pdf_path: Optional[str], pdf_bytes: Optional[bytes] = None) -> Dict:
+        """Shape the generator response; formats that were not requested are None"""
+        result = {
             'text_content': text_content,
             'pdf_path': pdf_path,
-            'filename': os.path.basename(pdf_path),
+            'filename': os.path.basename(pdf_path) if pdf_path else None,
             'enhancement_level': 'premium_ai',
             'perplexity_powered': True
         }
+        
+        # Only on request, so the dict stays JSON-serializable and callers don't hold a second copy of the PDF
+        if pdf_bytes is not None:
+            result['pdf_bytes'] = pdf_bytes
+        return result
     
     def _extract_enhanced_personal_info(self, text: str, analysis: Dict) -> Dict:
         """Extract and enhance personal information"""
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
-        name = lines[0] if lines else "Professional Name"
+        # Only the first non-empty line is needed, so stop scanning as soon as it is found
+        name_line = _NAME_LINE_RE.search(text)
+        name = name_line.group().strip() if name_line else "Professional Name"
         
         contact_info = analysis.get('contact_info', {})
         
+        linkedin = _LINKEDIN_RE.search(text)
+        location = _LOCATION_RE.search(text) or _LOCATION_FALLBACK_RE.search(text)
+        portfolio = next(
+            (f"https://{domain}" for domain in _PORTFOLIO_RE.findall(text)
+             if 'linkedin' not in domain and 'email' not in domain),
+            None
+        )
+        
         return {
             'name': name,
             'email': contact_info.get('email'),
             'phone': contact_info.get('phone'),
-            'linkedin': self._extract_linkedin(text),
-            'location': self._extract_location(text),
-            'portfolio': self._extract_portfolio(text)
+            'linkedin': f"linkedin.com/in/{linkedin.group(1)}" if linkedin else None,
+            'location': location.group(1) if location else None,
+            'portfolio': portfolio
         }
     
     def _create_premium_skills_section(self, resume_analysis: Dict, job_analysis: Dict) -> Dict:
         """Create premium skills section with AI insights"""
         
-        # Get skills with priority ranking
-        resume_tech = set(resume_analysis.get('technical_skills', []))
-        job_tech = set(job_analysis.get('technical_skills', []))
+        # Get skills with priority ranking (deduplicated, input order kept)
+        resume_tech = dict.fromkeys(resume_analysis.get('technical_skills', []))
+        job_tech = dict.fromkeys(job_analysis.get('technical_skills', []))
         
-        # Prioritize matched skills
-        matched_skills = list(resume_tech.intersection(job_tech))
-        additional_resume_skills = list(resume_tech - job_tech)
-        recommended_skills = list(job_tech - resume_tech)
+        # Prioritize matched skills in one pass over the resume skills
+        matched_skills, additional_resume_skills = [], []
+        for skill in resume_tech:
+            (matched_skills if skill in job_tech else additional_resume_skills).append(skill)
+        recommended_skills = [skill for skill in job_tech if skill not in resume_tech][:5]
         
         return {
             'priority_skills': matched_skills,
             'additional_skills': additional_resume_skills,
-            'recommended_additions': recommended_skills[:5],
+            'recommended_additions': recommended_skills,
             'soft_skills': resume_analysis.get('soft_skills', [])
         }
     
-    def _generate_premium_pdf(self, content: Dict, job_analysis: Dict) -> str:
-        """Generate premium AI-optimized PDF"""
+    def _join_skill_lists(self, skills: Dict) -> Dict:
+        """Join the skill lists once so the PDF and text versions can share them"""
+        additional = skills.get('additional_skills', [])
+        return {
+            'priority': ', '.join(skills.get('priority_skills', [])),
+            'additional_top8': ', '.join(additional[:8]),
+            'additional_full': ', '.join(additional),
+            'soft_top6': ', '.join(skills.get('soft_skills', [])[:6])
+        }
+    
+    def _generate_premium_pdf(self, content: Dict, job_analysis: Dict) -> Tuple[str, bytes]:
+        """Generate premium AI-optimized PDF, returning its path and bytes"""
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"ai_optimized_resume_{timestamp}.pdf"
-        file_path = f"uploads/optimized/{filename}"
+        file_path = f"{_OUT_DIR}/{filename}"
         
         # Create premium document
-        doc = SimpleDocTemplate(
-            file_path,
+        buf = io.BytesIO()
+        doc = BaseDocTemplate(
+            buf,
             pagesize=letter,
             rightMargin=0.75*inch,
             leftMargin=0.75*inch,
             topMargin=0.75*inch,
             bottomMargin=0.75*inch
         )
+        doc.addPageTemplates([_premium_page_template()])
         
         story = []
         personal_info = content['personal_info']
+        header_style = self.styles['AccentHeader']
+        achievement_style = self.styles['Achievement']
         
         # Executive header with name
-        if personal_info.get('name'):
-            story.append(Paragraph(personal_info['name'], self.styles['ExecutiveName']))
+        if (name := personal_info.get('name')):
+            story.append(Paragraph(name, self.styles['ExecutiveName']))
         
         # Premium contact information
-        contact_parts = []
-        if personal_info.get('email'):
-            contact_parts.append(f"📧 {personal_info['email']}")
-        if personal_info.get('phone'):
-            contact_parts.append(f"📱 {personal_info['phone']}")
-        if personal_info.get('linkedin'):
-            contact_parts.append(f"🔗 {personal_info['linkedin']}")
-        if personal_info.get('location'):
-            contact_parts.append(f"📍 {personal_info['location']}")
-        
-        if contact_parts:
-            contact_text = ' | '.join(contact_parts)
+        contact_text = ' | '.join(
+            f"{emoji} {value}" for key, emoji in self._CONTACT_FIELDS
+            if (value := personal_info.get(key))
+        )
+        
+        if contact_text:
             story.append(Paragraph(contact_text, self.styles['PremiumContact']))
         
         # AI-optimized professional summary
-        if content.get('ai_summary'):
-            story.append(Paragraph("EXECUTIVE SUMMARY", self.styles['AccentHeader']))
-            story.append(Paragraph(content['ai_summary'], self.styles['AISummary']))
+        if (ai_summary := content.get('ai_summary')):
+            story.append(Paragraph("EXECUTIVE SUMMARY", header_style))
+            story.append(Paragraph(ai_summary, self.styles['AISummary']))
         
         # Key achievements section
         key_achievements = content.get('key_achievements', [])
         if key_achievements:
-            story.append(Paragraph("KEY ACHIEVEMENTS", self.styles['AccentHeader']))
-            for achievement in key_achievements:
-                story.append(Paragraph(f"🏆 {achievement}", self.styles['Achievement']))
+            story.append(Paragraph("KEY ACHIEVEMENTS", header_style))
+            story.extend(Paragraph(f"{_EMOJI_TROPHY}{achievement}", achievement_style) for achievement in key_achievements)
             story.append(Spacer(1, 12))
         
         # Premium technical skills
         skills = content.get('optimized_skills', {})
-        if skills.get('priority_skills') or skills.get('additional_skills'):
-            story.append(Paragraph("TECHNICAL EXPERTISE", self.styles['AccentHeader']))
+        priority_skills = skills.get('priority_skills')
+        additional_skills = skills.get('additional_skills')
+        if priority_skills or additional_skills:
+            story.append(Paragraph("TECHNICAL EXPERTISE", header_style))
             
             # Create premium skills table
+            joined = content.get('joined_skills') or self._join_skill_lists(skills)
             skills_data = []
             
-            if skills.get('priority_skills'):
-                skills_data.append(['Core Technologies:', ', '.join(skills['priority_skills'])])
+            if priority_skills:
+                skills_data.append(['Core Technologies:', joined['priority']])
             
-            if skills.get('additional_skills'):
-                skills_data.append(['Additional Skills:', ', '.join(skills['additional_skills'][:8])])
+            if additional_skills:
+                skills_data.append(['Additional Skills:', joined['additional_top8']])
             
             if skills.get('soft_skills'):
-                skills_data.append(['Professional Skills:', ', '.join(skills['soft_skills'][:6])])
+                skills_data.append(['Professional Skills:', joined['soft_top6']])
             
             if skills_data:
                 skills_table = Table(skills_data, colWidths=[1.5*inch, 5*inch])
@@ -255,115 +417,95 @@ class AIEnhancedResumeGenerator:
         # Professional experience with AI enhancements
         enhanced_experience = content.get('enhanced_experience', [])
         if enhanced_experience:
-            story.append(Paragraph("PROFESSIONAL EXPERIENCE", self.styles['AccentHeader']))
+            story.append(Paragraph("PROFESSIONAL EXPERIENCE", header_style))
             
             # Add enhanced experience bullets
-            for exp in enhanced_experience:
-                story.append(Paragraph(f"• {exp}", self.styles['Achievement']))
+            story.extend(Paragraph(f"{_EMOJI_BULLET}{exp}", achievement_style) for exp in enhanced_experience)
             
             story.append(Spacer(1, 16))
         
         # AI insights footer
         if content.get('perplexity_insights'):
-            story.append(Paragraph("OPTIMIZATION NOTES", self.styles['AccentHeader']))
+            story.append(Paragraph("OPTIMIZATION NOTES", header_style))
             story.append(Paragraph(
                 "This resume has been AI-optimized using advanced analysis for maximum ATS compatibility and recruiter appeal.",
                 self.styles['Normal']
             ))
         
-        # Build the premium PDF
+        # Build the premium PDF in memory, then persist it
         doc.build(story)
-        return file_path
+        pdf_bytes = buf.getvalue()
+        _write_atomic(file_path, pdf_bytes)
+        return file_path, pdf_bytes
     
     def _generate_premium_text(self, content: Dict) -> str:
         """Generate premium text version"""
         
-        text_parts = []
+        buf = io.StringIO()
+        write = buf.write
         personal_info = content['personal_info']
         
         # Header
-        if personal_info.get('name'):
-            name = personal_info['name']
-            text_parts.append(name.upper())
-            text_parts.append('=' * len(name))
+        if (name := personal_info.get('name')):
+            write(f"{name.upper()}\n{'=' * len(name)}\n")
         
         # Contact info
-        contact_parts = []
-        for field in ['email', 'phone', 'linkedin', 'location']:
-            if personal_info.get(field):
-                contact_parts.append(f"{field.title()}: {personal_info[field]}")
+        contact_text = '\n'.join(
+            f"{label}: {value}" for key, label in _CONTACT_LABELS
+            if (value := personal_info.get(key))
+        )
         
-        if contact_parts:
-            text_parts.extend(contact_parts)
-            text_parts.append('')
+        if contact_text:
+            write(f"{contact_text}\n\n")
         
         # AI-optimized summary
-        if content.get('ai_summary'):
-            text_parts.append('EXECUTIVE SUMMARY')
-            text_parts.append('-' * 17)
-            text_parts.append(content['ai_summary'])
-            text_parts.append('')
+        if (ai_summary := content.get('ai_summary')):
+            write(f"EXECUTIVE SUMMARY\n{_SUMMARY_RULE}\n")
+            write(f"{ai_summary}\n\n")
         
         # Key achievements
-        if content.get('key_achievements'):
-            text_parts.append('KEY ACHIEVEMENTS')
-            text_parts.append('-' * 16)
-            for achievement in content['key_achievements']:
-                text_parts.append(f"🏆 {achievement}")
-            text_parts.append('')
+        if (key_achievements := content.get('key_achievements')):
+            write(f"KEY ACHIEVEMENTS\n{_ACH_RULE}\n")
+            for achievement in key_achievements:
+                write(f"{_EMOJI_TROPHY}{achievement}\n")
+            write('\n')
         
         # Technical skills
         skills = content.get('optimized_skills', {})
         if skills:
-            text_parts.append('TECHNICAL EXPERTISE')
-            text_parts.append('-' * 19)
+            priority_skills = skills.get('priority_skills')
+            additional_skills = skills.get('additional_skills')
+            write(f"TECHNICAL EXPERTISE\n{_SKILLS_RULE}\n")
+            joined = content.get('joined_skills') or self._join_skill_lists(skills)
             
-            if skills.get('priority_skills'):
-                text_parts.append(f"Core Technologies: {', '.join(skills['priority_skills'])}")
+            if priority_skills:
+                write(f"Core Technologies: {joined['priority']}\n")
             
-            if skills.get('additional_skills'):
-                text_parts.append(f"Additional Skills: {', '.join(skills['additional_skills'])}")
+            if additional_skills:
+                write(f"Additional Skills: {joined['additional_full']}\n")
             
-            text_parts.append('')
+            write('\n')
         
         # Enhanced experience
-        if content.get('enhanced_experience'):
-            text_parts.append('PROFESSIONAL EXPERIENCE (AI-ENHANCED)')
-            text_parts.append('-' * 38)
-            for exp in content['enhanced_experience']:
-                text_parts.append(f"• {exp}")
-            text_parts.append('')
-        
-        return '\n'.join(text_parts)
-    
-    def _extract_linkedin(self, text: str) -> str:
-        """Extract LinkedIn profile"""
-        import re
-        linkedin_pattern = r'linkedin\.com/(?:in/)?([A-Za-z0-9-]+)'
-        matches = re.findall(linkedin_pattern, text)
-        return f"linkedin.com/in/{matches[0]}" if matches else None
-    
-    def _extract_location(self, text: str) -> str:
-        """Extract location information"""
-        import re
-        location_patterns = [
-            r'([A-Za-z\s]+,\s*[A-Za-z]{2})',
-            r'([A-Za-z\s]+,\s*[A-Za-z\s]+)'
-        ]
-        
-        for pattern in location_patterns:
-            matches = re.findall(pattern, text)
-            if matches:
-                return matches[0]
-        return None
-    
-    def _extract_portfolio(self, text: str) -> str:
-        """Extract portfolio or website URL"""
-        import re
-        url_pattern = r'https?://(?:www\.)?([A-Za-z0-9.-]+\.[A-Za-z]{2,})'
-        matches = re.findall(url_pattern, text)
-        
-        for match in matches:
-            if 'linkedin' not in match and 'email' not in match:
-                return f"https://{match}"
-        return None
+        if (enhanced_experience := content.get('enhanced_experience')):
+            write(f"PROFESSIONAL EXPERIENCE (AI-ENHANCED)\n{_EXP_RULE}\n")
+            for exp in enhanced_experience:
+                write(f"{_EMOJI_BULLET}{exp}\n")
+            write('\n')
+        
+        # Every line was newline-terminated; drop the last one like '\n'.join did
+        return buf.getvalue()[:-1]
+
+
+# Shared generator; it keeps no per-request state, so one instance serves every request
+_GENERATOR: Optional[AIEnhancedResumeGenerator] = None
+_GENERATOR_LOCK = threading.Lock()
+
+def get_generator() -> AIEnhancedResumeGenerator:
+    """Create the shared generator on first use"""
+    global _GENERATOR
+    if _GENERATOR is None:
+        with _GENERATOR_LOCK:
+            if _GENERATOR is None:
+                _GENERATOR = AIEnhancedResumeGenerator()
+    return _GENERATOR
@@ -1,8 +1,22 @@
 # app/services/ats_resume_layouts.py - Professional ATS Resume Layouts
 from typing import Dict, List, Optional
-from datetime import datetime
+import asyncio
+import atexit
+import contextlib
+import hashlib
+import html
+import json
+import logging
 import os
 import re
+import shutil
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, is_dataclass
+from functools import lru_cache
+from itertools import chain
+from jinja2 import Environment
 from reportlab.lib.pagesizes import letter
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, KeepTogether
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -10,136 +24,491 @@ from reportlab.lib.units import inch, mm
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT, TA_JUSTIFY
 
+logger = logging.getLogger(__name__)
+
+# Extraction patterns, compiled once at import
+_PHONE_CLEAN = re.compile(r'[\+\d\s\-\(\)]{10,}')
+_EMAIL_CLEAN = re.compile(r'\S+@\S+')
+_PHONE_EXTRACT = re.compile(r'(\+91[\s\-]?)?[6789]\d{9}')
+_LINKEDIN = re.compile(r'linkedin\.com/in/([A-Za-z0-9\-]+)')
+_GITHUB = re.compile(r'github\.com/([A-Za-z0-9\-]+)')
+_EXP_HDR = re.compile(r'(professional\s+)?experience|work\s+experience|employment', re.I)
+_OTHER_HDR = re.compile(r'education|skills|projects|certifications', re.A | re.I)
+_DATE_PAT = re.compile(r'(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec|\d{4})', re.I)
+# Education scan section headers, matched as lowercase prefixes of the line
+_EDU_OPENERS = ('education', 'academic', 'qualifications')
+_EDU_CLOSERS = ('experience', 'skills', 'projects')
+_EDU_PREFIX_LEN = max(map(len, _EDU_OPENERS + _EDU_CLOSERS))
+_DEGREE_TOKENS = ('bachelor', 'master', 'btech', 'b.tech', 'mtech', 'm.tech', 'phd', 'diploma')
+
+@dataclass(slots=True, frozen=True)
+class Experience:
+    """One parsed role; slotted so the renderers read fields without dict lookups"""
+    company: str = ''
+    position: str = ''
+    dates: str = ''
+    location: str = ''
+    responsibilities: tuple = ()
+    
+    @classmethod
+    def from_builder(cls, fields: Dict) -> 'Experience':
+        """Freeze the mutable dict the extractor fills line by line"""
+        return cls(**{**fields, 'responsibilities': tuple(fields['responsibilities'])})
+
+@dataclass(slots=True, frozen=True)
+class ParsedResume:
+    """Original resume text split once and shared by every extractor"""
+    text: str
+    lines: tuple  # Stripped, non-empty lines in order
+
+def _parse_resume_text(text: str) -> ParsedResume:
+    """Split resume text into stripped, non-empty lines"""
+    return ParsedResume(text, tuple(filter(None, map(str.strip, text.splitlines()))))
+
+# Bullet markers seen in PDF-to-text output; only leading markers are stripped so hyphenated words survive
+_BULLET_CHARS = frozenset('•●▪◦-–—*')
+_BULLET_LEAD = ''.join(_BULLET_CHARS) + ' '
+
+# Contact fields in the order every layout prints them
+_CONTACT_KEYS = ('phone', 'email', 'linkedin', 'github')
+
+def _contact_parts(personal_info: Dict, keys: tuple = _CONTACT_KEYS) -> List[str]:
+    """Non-empty contact values for the given keys, in order"""
+    return [value for value in map(personal_info.get, keys) if value]
+
+def _escape(text: str) -> str:
+    """Escape &, < and > so Paragraph markup shows resume text literally"""
+    return html.escape(text, quote=False)
+
+def _stamp() -> str:
+    """Nanosecond hex timestamp; unique for resumes built within the same second"""
+    return f"{time.time_ns():x}"
+
+class _PDFSink:
+    """Write target for doc.build that collects the written chunks.
+    
+    A single write is returned as-is, skipping BytesIO's buffer and getvalue() copy;
+    several writes are joined.
+    """
+    __slots__ = ('chunks',)
+    
+    def __init__(self):
+        self.chunks = []
+    
+    def write(self, data: bytes) -> int:
+        self.chunks.append(data)
+        return len(data)
+    
+    def getvalue(self) -> bytes:
+        return self.chunks[0] if len(self.chunks) == 1 else b''.join(self.chunks)
+
+def _render_story(story: list, margins: Dict) -> bytes:
+    """Lay out a finished story on letter pages and return the PDF bytes"""
+    buf = _PDFSink()
+    SimpleDocTemplate(buf, **margins).build(story)
+    return buf.getvalue()
+
+# Content-addressed cache of built PDFs; bump the version when layout output changes
+_CACHE_DIR = 'uploads/cache'
+_CACHE_VERSION = 2
+_CACHE_MAX_ENTRIES = 256  # Least recently used PDFs beyond this are evicted
+_CACHE_KEEP_ENTRIES = _CACHE_MAX_ENTRIES * 3 // 4  # Eviction trims down to this, so listings stay rare
+_CACHE_COUNT = None  # Entries in the cache dir; counted once, then tracked per insert
+_CACHE_COUNT_LOCK = threading.Lock()
+
+def _json_default(obj):
+    """Serialize Experience records as their field dicts, anything else as str"""
+    return asdict(obj) if is_dataclass(obj) else str(obj)
+
+def _content_key(data: Dict, layout: str) -> str:
+    """Stable hash of the processed resume data for one layout"""
+    payload = json.dumps(data, sort_keys=True, default=_json_default).encode()
+    digest = hashlib.blake2b(payload, digest_size=16).hexdigest()
+    return f"{layout}_v{_CACHE_VERSION}_{digest}"
+
+def _copy_file(src: str, dst: str) -> None:
+    """Copy src over dst through a temp file, so dst is never seen half-written"""
+    tmp = f"{dst}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        shutil.copyfile(src, tmp)
+        os.replace(tmp, dst)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp)
+        raise
+
+def _copy_from_cache(cache_path: str, dst: str) -> bool:
+    """Copy a cached PDF to dst and mark it recently used; False on a cache miss"""
+    try:
+        _copy_file(cache_path, dst)
+        os.utime(cache_path)
+    except FileNotFoundError:
+        return False
+    return True
+
+def _prune_cache(keep: int) -> int:
+    """Evict all but the `keep` most recently used cache entries, returning how many remain"""
+    try:
+        entries = [entry for entry in os.scandir(_CACHE_DIR) if entry.name.endswith('.pdf')]
+    except OSError:
+        return 0
+    if len(entries) <= keep:
+        return len(entries)
+    
+    def mtime(entry):
+        try:
+            return entry.stat().st_mtime
+        except OSError:
+            return 0.0
+    
+    entries.sort(key=mtime)
+    for entry in entries[:-keep]:
+        with contextlib.suppress(OSError):
+            os.remove(entry.path)
+    return keep
+
+def _store_in_cache(src: str, cache_path: str) -> None:
+    """Copy a freshly written PDF into the cache, evicting old entries once it is over the cap"""
+    global _CACHE_COUNT
+    _copy_file(src, cache_path)
+    with _CACHE_COUNT_LOCK:
+        # Overwrites and other processes make the count drift; every listing resets it
+        if _CACHE_COUNT is None:
+            _CACHE_COUNT = _prune_cache(_CACHE_MAX_ENTRIES)
+        else:
+            _CACHE_COUNT += 1
+        if _CACHE_COUNT > _CACHE_MAX_ENTRIES:
+            _CACHE_COUNT = _prune_cache(_CACHE_KEEP_ENTRIES)
+
+# Worker pool for batch PDF builds; doc.build is CPU-bound and holds the GIL
+_PDF_POOL = None
+_PDF_POOL_LOCK = threading.Lock()
+
+def _get_pdf_pool() -> ProcessPoolExecutor:
+    """Create the shared PDF worker pool on first use"""
+    global _PDF_POOL
+    if _PDF_POOL is None:
+        with _PDF_POOL_LOCK:
+            if _PDF_POOL is None:
+                _PDF_POOL = ProcessPoolExecutor(max_workers=os.cpu_count())
+                atexit.register(_shutdown_pdf_pool)
+    return _PDF_POOL
+
+def _shutdown_pdf_pool() -> None:
+    """Stop the PDF worker pool; registered with atexit when the pool starts"""
+    global _PDF_POOL
+    with _PDF_POOL_LOCK:
+        pool, _PDF_POOL = _PDF_POOL, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+# Skill categories in priority order; a skill lands in the first category with a keyword inside it
+_SKILL_KEYWORDS = (
+    ('programming', ('python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'php', 'ruby', 'go', 'sql', 'html', 'css')),
+    ('frameworks', ('react', 'angular', 'vue', 'nodejs', 'django', 'flask', 'spring', 'express', 'tailwind')),
+    ('databases', ('mysql', 'postgresql', 'mongodb', 'redis', 'sqlite', 'oracle')),
+    ('cloud', ('aws', 'azure', 'gcp', 'docker', 'kubernetes', 'git', 'github'))
+)
+_SKILL_CATEGORIES = tuple(category for category, _ in _SKILL_KEYWORDS) + ('other',)
+_SKILL_RANK = {category: rank for rank, category in enumerate(_SKILL_CATEGORIES)}
+_CATEGORY_LABELS = {category: category.title() for category in _SKILL_CATEGORIES}
+_SKILL_TOKEN = re.compile(r'[a-z0-9+#.]+')
+
+# Every keyword in one zero-width scan; at each position the highest-priority category wins
+_SKILL_SCAN = re.compile('(?=' + '|'.join(
+    f"(?P<{category}>{'|'.join(map(re.escape, keywords))})"
+    for category, keywords in _SKILL_KEYWORDS
+) + ')')
+
+def _scan_category(skill_lower: str, stop: int = len(_SKILL_KEYWORDS)) -> str:
+    """Highest-priority category (ranked ahead of `stop`) with a keyword inside skill_lower"""
+    best = stop
+    for match in _SKILL_SCAN.finditer(skill_lower):
+        rank = _SKILL_RANK[match.lastgroup]
+        if rank < best:
+            best = rank
+            if not rank:
+                break
+    return _SKILL_CATEGORIES[best]
+
+# Rank of the category each keyword itself lands in ('django' contains 'go', so it ranks as programming)
+_KEYWORD_RANK = {
+    kw: _SKILL_RANK[_scan_category(kw)]
+    for _, keywords in _SKILL_KEYWORDS for kw in keywords
+}
+
+# Batches repeat the same skill names across resumes, so each one is lowercased and categorized once per process
+@lru_cache(maxsize=4096)
+def _skill_category(skill: str) -> str:
+    """Category of a skill by case-insensitive keyword substring match.
+    
+    A skill containing a keyword token can rank no lower than that keyword, so the
+    scan is only needed when the best token leaves room for a higher category.
+    """
+    skill_lower = skill.lower()
+    bound = min(
+        (_KEYWORD_RANK[token] for token in _SKILL_TOKEN.findall(skill_lower) if token in _KEYWORD_RANK),
+        default=len(_SKILL_KEYWORDS)
+    )
+    return _scan_category(skill_lower, bound) if bound else _SKILL_CATEGORIES[0]
+
+def _build_ats_styles():
+    """Build the ATS stylesheet once; every ATSResumeLayouts instance shares it"""
+    styles = getSampleStyleSheet()
+    
+    # Name header - clean and professional
+    styles.add(ParagraphStyle(
+        name='ATSName',
+        parent=styles['Normal'],
+        fontSize=18,
+        fontName='Helvetica-Bold',
+        spaceAfter=6,
+        alignment=TA_CENTER,
+        textColor=colors.HexColor('#2c3e50')
+    ))
+    
+    # Contact info - single line format
+    styles.add(ParagraphStyle(
+        name='ATSContact',
+        parent=styles['Normal'],
+        fontSize=10,
+        fontName='Helvetica',
+        spaceAfter=12,
+        alignment=TA_CENTER,
+        textColor=colors.HexColor('#34495e')
+    ))
+    
+    # Professional summary/objective
+    styles.add(ParagraphStyle(
+        name='ATSSummaryTitle',
+        parent=styles['Normal'],
+        fontSize=12,
+        fontName='Helvetica-Bold',
+        spaceAfter=6,
+        spaceBefore=12,
+        textColor=colors.HexColor('#2c3e50'),
+        alignment=TA_LEFT
+    ))
+    
+    # Section headers
+    styles.add(ParagraphStyle(
+        name='ATSSectionHeader',
+        parent=styles['Normal'],
+        fontSize=11,
+        fontName='Helvetica-Bold',
+        spaceAfter=8,
+        spaceBefore=16,
+        textColor=colors.HexColor('#2c3e50'),
+        alignment=TA_LEFT,
+        borderWidth=0.5,
+        borderColor=colors.HexColor('#bdc3c7'),
+        borderPadding=2
+    ))
+    
+    # Experience company/title
+    styles.add(ParagraphStyle(
+        name='ATSCompanyTitle',
+        parent=styles['Normal'],
+        fontSize=11,
+        fontName='Helvetica-Bold',
+        spaceAfter=2,
+        spaceBefore=8,
+        textColor=colors.HexColor('#2c3e50')
+    ))
+    
+    # Experience details (dates, location)
+    styles.add(ParagraphStyle(
+        name='ATSDetails',
+        parent=styles['Normal'],
+        fontSize=10,
+        fontName='Helvetica',
+        spaceAfter=4,
+        textColor=colors.HexColor('#7f8c8d'),
+        alignment=TA_LEFT
+    ))
+    
+    # Bullet points
+    styles.add(ParagraphStyle(
+        name='ATSBullet',
+        parent=styles['Normal'],
+        fontSize=10,
+        fontName='Helvetica',
+        spaceAfter=3,
+        leftIndent=15,
+        bulletIndent=10,
+        textColor=colors.HexColor('#2c3e50')
+    ))
+    
+    # Skills categories
+    styles.add(ParagraphStyle(
+        name='ATSSkillCategory',
+        parent=styles['Normal'],
+        fontSize=10,
+        fontName='Helvetica-Bold',
+        spaceAfter=3,
+        textColor=colors.HexColor('#34495e')
+    ))
+    
+    # Skills list
+    styles.add(ParagraphStyle(
+        name='ATSSkillList',
+        parent=styles['Normal'],
+        fontSize=10,
+        fontName='Helvetica',
+        spaceAfter=6,
+        textColor=colors.HexColor('#2c3e50')
+    ))
+    
+    return styles
+
+_ATS_STYLES = _build_ats_styles()
+
+# Plain-text resume, compiled once to a generator of fragments; every emitted line ends with a newline.
+# Sections are passed as top-level names, and entries as field tuples the loops unpack,
+# so the template never goes through Jinja's attribute/item lookup.
+_TEXT_TEMPLATE = Environment(trim_blocks=True, auto_reload=False).from_string("""\
+{% if name %}
+{{ name }}
+{{ name_rule }}
+{% endif %}
+{% if contact %}
+{{ contact|join(' | ') }}
+
+{% endif %}
+{% if summary %}
+PROFESSIONAL SUMMARY
+--------------------
+{{ summary }}
+
+{% endif %}
+{% if skills %}
+TECHNICAL SKILLS
+---------------
+{% for label, skill_list in skill_rows %}
+• {{ label }}: {{ skill_list }}
+{% endfor %}
+
+{% endif %}
+{% if experience %}
+PROFESSIONAL EXPERIENCE
+------------------------
+{% for company, position, dates, location, responsibilities in experience %}
+{{ company }}
+{{ position }} | {{ dates }}
+{% if location %}
+{{ location }}
+{% endif %}
+{% for resp in responsibilities %}
+• {{ resp }}
+{% endfor %}
+
+{% endfor %}
+{% endif %}
+{% if education %}
+EDUCATION
+---------
+{% for institution, degree, year in education %}
+{{ institution }}
+{{ degree }} | {{ year }}
+
+{% endfor %}
+{% endif %}
+""")
+
+# Modern ATS skill rows: bold category label, then the comma-joined skills
+_SKILL_ROW = '• <b>{}:</b> {}'.format
+_SKILL_ROW_LABELS = (
+    ('programming', 'Programming'),
+    ('frameworks', 'Frameworks & Tools'),
+    ('databases', 'Databases'),
+    ('cloud', 'Cloud & DevOps'),
+    ('other', 'Data & Visualization')
+)
+
+@lru_cache(maxsize=512)
+def _summary(experience_years: int, top_skills: str, job_title: str) -> str:
+    """Professional summary text; batches repeat the same inputs often"""
+    return (
+        f"Results-driven professional with {experience_years}+ years of experience in {top_skills.lower()} and software development. "
+        "Proven track record of delivering high-quality solutions and driving organizational success. "
+        f"Seeking to leverage technical expertise and problem-solving skills in a {job_title.lower()} role."
+    )
+
+# Page geometry and table styles shared by every build
+_LETTER_MARGINS = dict(pagesize=letter, rightMargin=0.75*inch, leftMargin=0.75*inch, topMargin=0.75*inch, bottomMargin=0.75*inch)
+_CLASSIC_MARGINS = dict(pagesize=letter, rightMargin=inch, leftMargin=inch, topMargin=inch, bottomMargin=inch)
+
+_SKILLS_TABLE_STYLE = TableStyle([
+    ('ALIGN', (0, 0), (0, -1), 'LEFT'),
+    ('ALIGN', (1, 0), (1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('TOPPADDING', (0, 0), (-1, -1), 3),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
+])
+
+_POSITION_TABLE_STYLE = TableStyle([
+    ('ALIGN', (0, 0), (0, 0), 'LEFT'),
+    ('ALIGN', (1, 0), (1, 0), 'RIGHT'),
+    ('FONTNAME', (0, 0), (0, 0), 'Helvetica-Bold'),
+    ('FONTNAME', (1, 0), (1, 0), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 11),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('TOPPADDING', (0, 0), (-1, -1), 2),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
+])
+
+_EDU_TABLE_STYLE = TableStyle([
+    ('ALIGN', (0, 0), (0, -1), 'LEFT'),
+    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+])
+
 class ATSResumeLayouts:
     """
     Professional ATS-friendly resume layouts matching industry standards
     """
     
-    def __init__(self):
-        self.styles = getSampleStyleSheet()
-        self._setup_ats_styles()
-        
-        # Layout options
-        self.layouts = {
-            'modern_ats': self._generate_modern_ats,
-            'classic_professional': self._generate_classic_professional,
-            'tech_focused': self._generate_tech_focused,
-            'executive_style': self._generate_executive_style,
-            'clean_minimal': self._generate_clean_minimal
-        }
+    # Layout name -> generator method name, resolved on the instance at call time
+    _LAYOUT_DISPATCH = {
+        'modern_ats': '_generate_modern_ats',
+        'classic_professional': '_generate_classic_professional',
+        'tech_focused': '_generate_tech_focused',
+        'executive_style': '_generate_executive_style',
+        'clean_minimal': '_generate_clean_minimal'
+    }
+    
+    # Output directories are created on first write, then never checked again
+    _OUTPUT_DIR = 'uploads/optimized'
+    _OUTPUT_DIR_READY = False
+    _OUTPUT_DIR_LOCK = threading.Lock()
     
-    def _setup_ats_styles(self):
-        """Setup ATS-optimized professional styles"""
-        
-        # Name header - clean and professional
-        self.styles.add(ParagraphStyle(
-            name='ATSName',
-            parent=self.styles['Normal'],
-            fontSize=18,
-            fontName='Helvetica-Bold',
-            spaceAfter=6,
-            alignment=TA_CENTER,
-            textColor=colors.HexColor('#2c3e50')
-        ))
-        
-        # Contact info - single line format
-        self.styles.add(ParagraphStyle(
-            name='ATSContact',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            fontName='Helvetica',
-            spaceAfter=12,
-            alignment=TA_CENTER,
-            textColor=colors.HexColor('#34495e')
-        ))
-        
-        # Professional summary/objective
-        self.styles.add(ParagraphStyle(
-            name='ATSSummaryTitle',
-            parent=self.styles['Normal'],
-            fontSize=12,
-            fontName='Helvetica-Bold',
-            spaceAfter=6,
-            spaceBefore=12,
-            textColor=colors.HexColor('#2c3e50'),
-            alignment=TA_LEFT
-        ))
-        
-        # Section headers
-        self.styles.add(ParagraphStyle(
-            name='ATSSectionHeader',
-            parent=self.styles['Normal'],
-            fontSize=11,
-            fontName='Helvetica-Bold',
-            spaceAfter=8,
-            spaceBefore=16,
-            textColor=colors.HexColor('#2c3e50'),
-            alignment=TA_LEFT,
-            borderWidth=0.5,
-            borderColor=colors.HexColor('#bdc3c7'),
-            borderPadding=2
-        ))
-        
-        # Experience company/title
-        self.styles.add(ParagraphStyle(
-            name='ATSCompanyTitle',
-            parent=self.styles['Normal'],
-            fontSize=11,
-            fontName='Helvetica-Bold',
-            spaceAfter=2,
-            spaceBefore=8,
-            textColor=colors.HexColor('#2c3e50')
-        ))
-        
-        # Experience details (dates, location)
-        self.styles.add(ParagraphStyle(
-            name='ATSDetails',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            fontName='Helvetica',
-            spaceAfter=4,
-            textColor=colors.HexColor('#7f8c8d'),
-            alignment=TA_LEFT
-        ))
-        
-        # Bullet points
-        self.styles.add(ParagraphStyle(
-            name='ATSBullet',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            fontName='Helvetica',
-            spaceAfter=3,
-            leftIndent=15,
-            bulletIndent=10,
-            textColor=colors.HexColor('#2c3e50')
-        ))
-        
-        # Skills categories
-        self.styles.add(ParagraphStyle(
-            name='ATSSkillCategory',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            fontName='Helvetica-Bold',
-            spaceAfter=3,
-            textColor=colors.HexColor('#34495e')
-        ))
-        
-        # Skills list
-        self.styles.add(ParagraphStyle(
-            name='ATSSkillList',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            fontName='Helvetica',
-            spaceAfter=6,
-            textColor=colors.HexColor('#2c3e50')
-        ))
+    @classmethod
+    def _ensure_output_dir(cls) -> None:
+        """Create the output and cache directories once per process"""
+        if cls._OUTPUT_DIR_READY:
+            return
+        with cls._OUTPUT_DIR_LOCK:
+            if not cls._OUTPUT_DIR_READY:
+                os.makedirs(cls._OUTPUT_DIR, exist_ok=True)
+                os.makedirs(_CACHE_DIR, exist_ok=True)
+                cls._OUTPUT_DIR_READY = True
+    
+    def __init__(self):
+        self.styles = _ATS_STYLES
     
     def generate_ats_resume(self, resume_data: Dict, layout: str = 'modern_ats') -> Dict:
         """
         Generate professional ATS resume with selected layout
         """
-        if layout not in self.layouts:
-            layout = 'modern_ats'
+        method_name = self._LAYOUT_DISPATCH.get(layout)
+        if method_name is None:
+            layout, method_name = 'modern_ats', '_generate_modern_ats'
         
         print(f"🎨 Generating ATS resume with {layout} layout...")
         
@@ -147,22 +516,79 @@ class ATSResumeLayouts:
         processed_data = self._process_resume_data(resume_data)
         
         # Generate with selected layout
-        return self.layouts[layout](processed_data)
+        return getattr(self, method_name)(processed_data)
+    
+    async def generate_ats_resume_async(self, resume_data: Dict, layout: str = 'modern_ats') -> Dict:
+        """
+        Generate an ATS resume in a worker thread so the event loop keeps serving requests
+        """
+        return await asyncio.to_thread(self.generate_ats_resume, resume_data, layout)
+    
+    def generate_many(self, resumes: List[Dict], layout: str = 'modern_ats') -> List[Dict]:
+        """
+        Generate ATS resumes for a batch, building the PDFs in parallel worker processes
+        """
+        if layout not in _BATCH_BUILDERS:
+            layout = 'modern_ats'
+        
+        logger.info("Generating %d ATS resumes with %s layout", len(resumes), layout)
+        
+        self._ensure_output_dir()
+        timestamp = _stamp()
+        processed_list = [self._process_resume_data(resume) for resume in resumes]
+        results = []
+        pending = {}  # cache_path -> (data, output paths); identical jobs are built once
+        
+        for i, data in enumerate(processed_list):
+            filename = f"{layout}_resume_{timestamp}_{i}.pdf"
+            file_path = f"{self._OUTPUT_DIR}/{filename}"
+            cache_path = f"{_CACHE_DIR}/{_content_key(data, layout)}.pdf"
+            
+            # Identical content was built before - no need to render it again
+            if cache_path in pending:
+                pending[cache_path][1].append(file_path)
+            elif not _copy_from_cache(cache_path, file_path):
+                pending[cache_path] = (data, [file_path])
+            
+            results.append({
+                'filename': filename,
+                'pdf_path': file_path,
+                'layout': layout,
+                'text_content': self._generate_text_version(data)
+            })
+        
+        # Build the misses in worker processes, write them out here
+        if pending:
+            builder = _BATCH_BUILDERS[layout]
+            pdfs = _get_pdf_pool().map(builder, [data for data, _ in pending.values()])
+            for (cache_path, (_, file_paths)), pdf in zip(pending.items(), pdfs):
+                for file_path in file_paths:
+                    with open(file_path, 'wb', buffering=0) as f:
+                        f.write(pdf)
+                try:
+                    _store_in_cache(file_paths[0], cache_path)
+                except OSError:
+                    logger.warning("Could not cache %s", cache_path, exc_info=True)
+        
+        return results
     
     def _process_resume_data(self, raw_data: Dict) -> Dict:
         """Process and clean resume data for ATS formatting"""
         
+        # Split the original text once; every extractor reads the same lines
+        parsed = _parse_resume_text(raw_data.get('original_resume_text', ''))
+        
         # Extract personal info
-        personal_info = self._extract_personal_info(raw_data)
+        personal_info = self._extract_personal_info(raw_data, parsed)
         
         # Extract and format experience
-        experience = self._extract_experience(raw_data)
+        experience = self._extract_experience(raw_data, parsed)
         
         # Extract skills by category
         skills = self._categorize_skills(raw_data)
         
         # Extract education
-        education = self._extract_education(raw_data)
+        education = self._extract_education(raw_data, parsed)
         
         return {
             'personal_info': personal_info,
@@ -176,18 +602,33 @@ class ATSResumeLayouts:
     def _generate_modern_ats(self, data: Dict) -> Dict:
         """Generate Modern ATS layout - clean and professional"""
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = _stamp()
         filename = f"modern_ats_resume_{timestamp}.pdf"
-        file_path = f"uploads/optimized/{filename}"
-        
-        doc = SimpleDocTemplate(
-            file_path,
-            pagesize=letter,
-            rightMargin=0.75*inch,
-            leftMargin=0.75*inch,
-            topMargin=0.75*inch,
-            bottomMargin=0.75*inch
-        )
+        file_path = f"{self._OUTPUT_DIR}/{filename}"
+        
+        # Build PDF (or reuse an identical earlier build)
+        self._write_pdf(file_path, _content_key(data, 'modern_ats'), self._render_modern_ats, data)
+        
+        return {
+            'filename': filename,
+            'pdf_path': file_path,
+            'layout': 'modern_ats',
+            'text_content': self._generate_text_version(data)
+        }
+    
+    def _render_modern_ats(self, data: Dict) -> bytes:
+        """Render the Modern ATS layout to PDF bytes"""
+        return _render_story(self._build_modern_ats_story(data), _LETTER_MARGINS)
+    
+    def _build_modern_ats_story(self, data: Dict) -> list:
+        """Build the Modern ATS flowables"""
+        
+        # Style lookups hoisted out of the section loops
+        section_style = self.styles['ATSSectionHeader']
+        company_style = self.styles['ATSCompanyTitle']
+        details_style = self.styles['ATSDetails']
+        bullet_style = self.styles['ATSBullet']
+        skill_style = self.styles['ATSSkillList']
         
         story = []
         personal_info = data['personal_info']
@@ -197,19 +638,9 @@ class ATSResumeLayouts:
             story.append(Paragraph(personal_info['name'].upper(), self.styles['ATSName']))
         
         # Contact information - single line
-        contact_parts = []
-        if personal_info.get('phone'):
-            contact_parts.append(personal_info['phone'])
-        if personal_info.get('email'):
-            contact_parts.append(personal_info['email'])
-        if personal_info.get('linkedin'):
-            contact_parts.append(personal_info['linkedin'])
-        if personal_info.get('github'):
-            contact_parts.append(personal_info['github'])
-        
+        contact_parts = _contact_parts(personal_info)
         if contact_parts:
-            contact_text = ' | '.join(contact_parts)
-            story.append(Paragraph(contact_text, self.styles['ATSContact']))
+            story.append(Paragraph(' | '.join(contact_parts), self.styles['ATSContact']))
         
         # Professional Summary/Objective
         if data.get('professional_summary'):
@@ -219,92 +650,89 @@ class ATSResumeLayouts:
         # Technical Skills
         skills = data.get('skills', {})
         if skills:
-            story.append(Paragraph("TECHNICAL SKILLS", self.styles['ATSSectionHeader']))
-            
-            if skills.get('programming'):
-                story.append(Paragraph(f"• <b>Programming:</b> {', '.join(skills['programming'])}", self.styles['ATSSkillList']))
-            
-            if skills.get('frameworks'):
-                story.append(Paragraph(f"• <b>Frameworks & Tools:</b> {', '.join(skills['frameworks'])}", self.styles['ATSSkillList']))
+            story.append(Paragraph("TECHNICAL SKILLS", section_style))
             
-            if skills.get('databases'):
-                story.append(Paragraph(f"• <b>Databases:</b> {', '.join(skills['databases'])}", self.styles['ATSSkillList']))
-            
-            if skills.get('cloud'):
-                story.append(Paragraph(f"• <b>Cloud & DevOps:</b> {', '.join(skills['cloud'])}", self.styles['ATSSkillList']))
-            
-            if skills.get('other'):
-                story.append(Paragraph(f"• <b>Data & Visualization:</b> {', '.join(skills['other'])}", self.styles['ATSSkillList']))
+            for category, label in _SKILL_ROW_LABELS:
+                if skills.get(category):
+                    story.append(Paragraph(_SKILL_ROW(label, ', '.join(skills[category])), skill_style))
         
         # Professional Experience
         experience = data.get('experience', [])
         if experience:
-            story.append(Paragraph("PROFESSIONAL EXPERIENCE", self.styles['ATSSectionHeader']))
+            story.append(Paragraph("PROFESSIONAL EXPERIENCE", section_style))
             
             for exp in experience:
                 # Company and position
-                company_title = f"{exp.get('company', 'Company Name')}"
-                if exp.get('location'):
-                    company_title += f" | {exp['location']}"
-                story.append(Paragraph(company_title, self.styles['ATSCompanyTitle']))
+                company_title = f"{exp.company}"
+                if exp.location:
+                    company_title += f" | {exp.location}"
+                story.append(Paragraph(_escape(company_title), company_style))
                 
                 # Position and dates
-                position_line = f"{exp.get('position', 'Position Title')}"
-                if exp.get('dates'):
-                    position_line += f" | {exp['dates']}"
-                story.append(Paragraph(position_line, self.styles['ATSDetails']))
+                position_line = f"{exp.position}"
+                if exp.dates:
+                    position_line += f" | {exp.dates}"
+                story.append(Paragraph(_escape(position_line), details_style))
                 
                 # Responsibilities/achievements
-                for responsibility in exp.get('responsibilities', []):
-                    story.append(Paragraph(f"• {responsibility}", self.styles['ATSBullet']))
+                # One paragraph per role; <br/> keeps each bullet on its own line
+                bullets_html = '<br/>'.join(f"• {_escape(r)}" for r in exp.responsibilities)
+                if bullets_html:
+                    story.append(Paragraph(bullets_html, bullet_style))
                 
                 story.append(Spacer(1, 6))
         
         # Education
         education = data.get('education', [])
         if education:
-            story.append(Paragraph("EDUCATION", self.styles['ATSSectionHeader']))
+            story.append(Paragraph("EDUCATION", section_style))
             
             for edu in education:
                 # Institution
                 institution = edu.get('institution', 'Institution Name')
                 if edu.get('location'):
                     institution += f" | {edu['location']}"
-                story.append(Paragraph(institution, self.styles['ATSCompanyTitle']))
+                story.append(Paragraph(_escape(institution), company_style))
                 
                 # Degree and year
                 degree_line = f"{edu.get('degree', 'Degree')}"
                 if edu.get('year'):
                     degree_line += f" | {edu['year']}"
-                story.append(Paragraph(degree_line, self.styles['ATSDetails']))
+                story.append(Paragraph(_escape(degree_line), details_style))
                 
                 story.append(Spacer(1, 6))
         
-        # Build PDF
-        doc.build(story)
+        return story
+    
+    def _generate_tech_focused(self, data: Dict) -> Dict:
+        """Generate Tech-Focused ATS layout"""
+        
+        timestamp = _stamp()
+        filename = f"tech_focused_resume_{timestamp}.pdf"
+        file_path = f"{self._OUTPUT_DIR}/{filename}"
+        
+        # Build PDF (or reuse an identical earlier build)
+        self._write_pdf(file_path, _content_key(data, 'tech_focused'), self._render_tech_focused, data)
         
         return {
             'filename': filename,
             'pdf_path': file_path,
-            'layout': 'modern_ats',
+            'layout': 'tech_focused',
             'text_content': self._generate_text_version(data)
         }
     
-    def _generate_tech_focused(self, data: Dict) -> Dict:
-        """Generate Tech-Focused ATS layout"""
+    def _render_tech_focused(self, data: Dict) -> bytes:
+        """Render the Tech-Focused ATS layout to PDF bytes"""
+        return _render_story(self._build_tech_focused_story(data), _LETTER_MARGINS)
+    
+    def _build_tech_focused_story(self, data: Dict) -> list:
+        """Build the Tech-Focused ATS flowables"""
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"tech_focused_resume_{timestamp}.pdf"
-        file_path = f"uploads/optimized/{filename}"
-        
-        doc = SimpleDocTemplate(
-            file_path,
-            pagesize=letter,
-            rightMargin=0.75*inch,
-            leftMargin=0.75*inch,
-            topMargin=0.75*inch,
-            bottomMargin=0.75*inch
-        )
+        # Style lookups hoisted out of the section loops
+        section_style = self.styles['ATSSectionHeader']
+        company_style = self.styles['ATSCompanyTitle']
+        details_style = self.styles['ATSDetails']
+        bullet_style = self.styles['ATSBullet']
         
         story = []
         personal_info = data['personal_info']
@@ -314,16 +742,7 @@ class ATSResumeLayouts:
             story.append(Paragraph(personal_info['name'], self.styles['ATSName']))
         
         # Contact info
-        contact_parts = []
-        if personal_info.get('phone'):
-            contact_parts.append(personal_info['phone'])
-        if personal_info.get('email'):
-            contact_parts.append(personal_info['email'])
-        if personal_info.get('linkedin'):
-            contact_parts.append(personal_info['linkedin'])
-        if personal_info.get('github'):
-            contact_parts.append(personal_info['github'])
-        
+        contact_parts = _contact_parts(personal_info)
         if contact_parts:
             story.append(Paragraph(' | '.join(contact_parts), self.styles['ATSContact']))
         
@@ -337,7 +756,7 @@ class ATSResumeLayouts:
         # Technical Skills - Detailed categories
         skills = data.get('skills', {})
         if skills:
-            story.append(Paragraph("TECHNICAL SKILLS", self.styles['ATSSectionHeader']))
+            story.append(Paragraph("TECHNICAL SKILLS", section_style))
             
             # Create skills table for better ATS parsing
             skills_data = []
@@ -359,62 +778,46 @@ class ATSResumeLayouts:
             
             if skills_data:
                 skills_table = Table(skills_data, colWidths=[1.5*inch, 5*inch])
-                skills_table.setStyle(TableStyle([
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-                    ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-                    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-                    ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-                    ('FONTSIZE', (0, 0), (-1, -1), 10),
-                    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                    ('TOPPADDING', (0, 0), (-1, -1), 3),
-                    ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
-                ]))
+                skills_table.setStyle(_SKILLS_TABLE_STYLE)
                 story.append(skills_table)
                 story.append(Spacer(1, 12))
         
         # Professional Experience
         experience = data.get('experience', [])
         if experience:
-            story.append(Paragraph("PROFESSIONAL EXPERIENCE", self.styles['ATSSectionHeader']))
+            story.append(Paragraph("PROFESSIONAL EXPERIENCE", section_style))
             
             for exp in experience:
                 # Company name
-                story.append(Paragraph(exp.get('company', 'Company Name'), self.styles['ATSCompanyTitle']))
+                story.append(Paragraph(_escape(exp.company), company_style))
                 
                 # Position and dates on same line
-                position_date = f"{exp.get('position', 'Position Title')}"
-                if exp.get('dates'):
+                position_date = f"{exp.position}"
+                if exp.dates:
                     # Create a table for position and dates alignment
-                    position_data = [[exp.get('position', 'Position Title'), exp['dates']]]
+                    position_data = [[exp.position, exp.dates]]
                     position_table = Table(position_data, colWidths=[4*inch, 2*inch])
-                    position_table.setStyle(TableStyle([
-                        ('ALIGN', (0, 0), (0, 0), 'LEFT'),
-                        ('ALIGN', (1, 0), (1, 0), 'RIGHT'),
-                        ('FONTNAME', (0, 0), (0, 0), 'Helvetica-Bold'),
-                        ('FONTNAME', (1, 0), (1, 0), 'Helvetica'),
-                        ('FONTSIZE', (0, 0), (-1, -1), 11),
-                        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                        ('TOPPADDING', (0, 0), (-1, -1), 2),
-                        ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
-                    ]))
+                    position_table.setStyle(_POSITION_TABLE_STYLE)
                     story.append(position_table)
                 else:
-                    story.append(Paragraph(position_date, self.styles['ATSDetails']))
+                    story.append(Paragraph(_escape(position_date), details_style))
                 
                 # Location if available
-                if exp.get('location'):
-                    story.append(Paragraph(exp['location'], self.styles['ATSDetails']))
+                if exp.location:
+                    story.append(Paragraph(_escape(exp.location), details_style))
                 
                 # Achievements with tech focus
-                for responsibility in exp.get('responsibilities', []):
-                    story.append(Paragraph(f"• {responsibility}", self.styles['ATSBullet']))
+                # One paragraph per role; <br/> keeps each bullet on its own line
+                bullets_html = '<br/>'.join(f"• {_escape(r)}" for r in exp.responsibilities)
+                if bullets_html:
+                    story.append(Paragraph(bullets_html, bullet_style))
                 
                 story.append(Spacer(1, 8))
         
         # Education
         education = data.get('education', [])
         if education:
-            story.append(Paragraph("EDUCATION", self.styles['ATSSectionHeader']))
+            story.append(Paragraph("EDUCATION", section_style))
             
             for edu in education:
                 # Create education table
@@ -431,35 +834,42 @@ class ATSResumeLayouts:
                 edu_data.append([institution_line, degree_year])
                 
                 edu_table = Table(edu_data, colWidths=[4*inch, 2*inch])
-                edu_table.setStyle(TableStyle([
-                    ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-                    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-                    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-                    ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-                    ('FONTSIZE', (0, 0), (-1, -1), 10),
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ]))
+                edu_table.setStyle(_EDU_TABLE_STYLE)
                 story.append(edu_table)
                 story.append(Spacer(1, 4))
         
-        # Build PDF
-        doc.build(story)
+        return story
+    
+    def _generate_classic_professional(self, data: Dict) -> Dict:
+        """Generate Classic Professional layout"""
+        
+        timestamp = _stamp()
+        filename = f"classic_professional_resume_{timestamp}.pdf"
+        file_path = f"{self._OUTPUT_DIR}/{filename}"
+        
+        # Build PDF (or reuse an identical earlier build)
+        self._write_pdf(file_path, _content_key(data, 'classic_professional'), self._render_classic_professional, data)
         
         return {
             'filename': filename,
             'pdf_path': file_path,
-            'layout': 'tech_focused',
+            'layout': 'classic_professional',
             'text_content': self._generate_text_version(data)
         }
     
-    def _generate_classic_professional(self, data: Dict) -> Dict:
-        """Generate Classic Professional layout"""
-        
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"classic_professional_resume_{timestamp}.pdf"
-        file_path = f"uploads/optimized/{filename}"
+    def _render_classic_professional(self, data: Dict) -> bytes:
+        """Render the Classic Professional layout to PDF bytes"""
+        return _render_story(self._build_classic_professional_story(data), _CLASSIC_MARGINS)
+    
+    def _build_classic_professional_story(self, data: Dict) -> list:
+        """Build the Classic Professional flowables"""
         
-        doc = SimpleDocTemplate(file_path, pagesize=letter, rightMargin=inch, leftMargin=inch, topMargin=inch, bottomMargin=inch)
+        # Style lookups hoisted out of the section loops
+        section_style = self.styles['ATSSectionHeader']
+        company_style = self.styles['ATSCompanyTitle']
+        details_style = self.styles['ATSDetails']
+        bullet_style = self.styles['ATSBullet']
+        skill_style = self.styles['ATSSkillList']
         
         story = []
         personal_info = data['personal_info']
@@ -473,21 +883,12 @@ class ATSResumeLayouts:
         if personal_info.get('address'):
             contact_lines.append(personal_info['address'])
         
-        phone_email = []
-        if personal_info.get('phone'):
-            phone_email.append(personal_info['phone'])
-        if personal_info.get('email'):
-            phone_email.append(personal_info['email'])
-        
+        phone_email = _contact_parts(personal_info, _CONTACT_KEYS[:2])
         if phone_email:
             contact_lines.append(' | '.join(phone_email))
         
-        if personal_info.get('linkedin') or personal_info.get('github'):
-            links = []
-            if personal_info.get('linkedin'):
-                links.append(personal_info['linkedin'])
-            if personal_info.get('github'):
-                links.append(personal_info['github'])
+        links = _contact_parts(personal_info, _CONTACT_KEYS[2:])
+        if links:
             contact_lines.append(' | '.join(links))
         
         for line in contact_lines:
@@ -495,60 +896,50 @@ class ATSResumeLayouts:
         
         # Objective/Summary
         if data.get('professional_summary'):
-            story.append(Paragraph("PROFESSIONAL SUMMARY", self.styles['ATSSectionHeader']))
+            story.append(Paragraph("PROFESSIONAL SUMMARY", section_style))
             story.append(Paragraph(data['professional_summary'], self.styles['Normal']))
             story.append(Spacer(1, 12))
         
         # Experience first (traditional format)
         experience = data.get('experience', [])
         if experience:
-            story.append(Paragraph("PROFESSIONAL EXPERIENCE", self.styles['ATSSectionHeader']))
+            story.append(Paragraph("PROFESSIONAL EXPERIENCE", section_style))
             
             for exp in experience:
                 # Traditional format: Company, Position, Dates
-                story.append(Paragraph(f"<b>{exp.get('company', 'Company Name')}</b>", self.styles['ATSCompanyTitle']))
-                story.append(Paragraph(f"{exp.get('position', 'Position Title')} | {exp.get('dates', 'Dates')}", self.styles['ATSDetails']))
+                story.append(Paragraph(f"<b>{_escape(exp.company)}</b>", company_style))
+                story.append(Paragraph(_escape(f"{exp.position} | {exp.dates}"), details_style))
                 
-                if exp.get('location'):
-                    story.append(Paragraph(exp['location'], self.styles['ATSDetails']))
+                if exp.location:
+                    story.append(Paragraph(_escape(exp.location), details_style))
                 
-                for responsibility in exp.get('responsibilities', []):
-                    story.append(Paragraph(f"• {responsibility}", self.styles['ATSBullet']))
+                # One paragraph per role; <br/> keeps each bullet on its own line
+                bullets_html = '<br/>'.join(f"• {_escape(r)}" for r in exp.responsibilities)
+                if bullets_html:
+                    story.append(Paragraph(bullets_html, bullet_style))
                 
                 story.append(Spacer(1, 8))
         
         # Education
         education = data.get('education', [])
         if education:
-            story.append(Paragraph("EDUCATION", self.styles['ATSSectionHeader']))
+            story.append(Paragraph("EDUCATION", section_style))
             
             for edu in education:
-                story.append(Paragraph(f"<b>{edu.get('institution', 'Institution')}</b>", self.styles['ATSCompanyTitle']))
-                story.append(Paragraph(f"{edu.get('degree', 'Degree')} | {edu.get('year', 'Year')}", self.styles['ATSDetails']))
+                story.append(Paragraph(f"<b>{_escape(edu.get('institution', 'Institution'))}</b>", company_style))
+                story.append(Paragraph(_escape(f"{edu.get('degree', 'Degree')} | {edu.get('year', 'Year')}"), details_style))
                 if edu.get('location'):
-                    story.append(Paragraph(edu['location'], self.styles['ATSDetails']))
+                    story.append(Paragraph(_escape(edu['location']), details_style))
                 story.append(Spacer(1, 6))
         
         # Technical Skills
         skills = data.get('skills', {})
         if skills:
-            story.append(Paragraph("TECHNICAL SKILLS", self.styles['ATSSectionHeader']))
-            
-            all_skills = []
-            for category, skill_list in skills.items():
-                all_skills.extend(skill_list)
+            story.append(Paragraph("TECHNICAL SKILLS", section_style))
             
-            story.append(Paragraph(', '.join(all_skills), self.styles['ATSSkillList']))
+            story.append(Paragraph(', '.join(chain.from_iterable(skills.values())), skill_style))
         
-        # Build PDF
-        doc.build(story)
-        
-        return {
-            'filename': filename,
-            'pdf_path': file_path,
-            'layout': 'classic_professional',
-            'text_content': self._generate_text_version(data)
-        }
+        return story
     
     def _generate_executive_style(self, data: Dict) -> Dict:
         """Generate Executive Style layout"""
@@ -560,21 +951,36 @@ class ATSResumeLayouts:
         # Implementation for minimal layout  
         return self._generate_modern_ats(data)  # Placeholder - will implement if needed
     
+    def _write_pdf(self, file_path: str, cache_key: str, render, data: Dict) -> None:
+        """Write the rendered PDF to file_path unless an identical PDF is already cached"""
+        self._ensure_output_dir()
+        cache_path = f"{_CACHE_DIR}/{cache_key}.pdf"
+        if _copy_from_cache(cache_path, file_path):
+            return
+        
+        # Render in memory, then hit the disk with a single write
+        with open(file_path, 'wb', buffering=0) as f:
+            f.write(render(data))
+        
+        try:
+            _store_in_cache(file_path, cache_path)
+        except OSError:
+            # Caching is best-effort; the resume itself is already written
+            logger.warning("Could not cache %s", cache_path, exc_info=True)
+    
     # Helper methods for data processing
-    def _extract_personal_info(self, raw_data: Dict) -> Dict:
+    def _extract_personal_info(self, raw_data: Dict, parsed: ParsedResume) -> Dict:
         """Extract and clean personal information"""
         
-        # Get original resume text
-        original_text = raw_data.get('original_resume_text', '')
+        original_text = parsed.text
         resume_analysis = raw_data.get('resume_analysis', {})
         
         # Extract name (first line typically)
-        lines = [line.strip() for line in original_text.split('\n') if line.strip()]
-        name = lines[0] if lines else "Your Name"
+        name = parsed.lines[0] if parsed.lines else "Your Name"
         
         # Clean name (remove email/phone if accidentally included)
-        name = re.sub(r'[\+\d\s\-\(\)]{10,}', '', name)  # Remove phone numbers
-        name = re.sub(r'\S+@\S+', '', name)  # Remove emails
+        name = _PHONE_CLEAN.sub('', name)  # Remove phone numbers
+        name = _EMAIL_CLEAN.sub('', name)  # Remove emails
         name = name.strip()
         
         # Extract contact info
@@ -583,19 +989,19 @@ class ATSResumeLayouts:
         # Extract phone from original text if not in analysis
         phone = contact_info.get('phone')
         if not phone:
-            phone_match = re.search(r'(\+91[\s\-]?)?[6789]\d{9}', original_text)
+            phone_match = _PHONE_EXTRACT.search(original_text)
             if phone_match:
                 phone = phone_match.group(0)
         
         # Extract LinkedIn
         linkedin = None
-        linkedin_match = re.search(r'linkedin\.com/in/([A-Za-z0-9\-]+)', original_text)
+        linkedin_match = _LINKEDIN.search(original_text)
         if linkedin_match:
             linkedin = f"https://linkedin.com/in/{linkedin_match.group(1)}"
         
         # Extract GitHub
         github = None
-        github_match = re.search(r'github\.com/([A-Za-z0-9\-]+)', original_text)
+        github_match = _GITHUB.search(original_text)
         if github_match:
             github = f"https://github.com/{github_match.group(1)}"
         
@@ -608,38 +1014,32 @@ class ATSResumeLayouts:
             'address': None  # Extract if needed
         }
     
-    def _extract_experience(self, raw_data: Dict) -> List[Dict]:
+    def _extract_experience(self, raw_data: Dict, parsed: ParsedResume) -> List[Experience]:
         """Extract and format professional experience"""
         
-        original_text = raw_data.get('original_resume_text', '')
-        lines = original_text.split('\n')
-        
         experiences = []
+        add_experience = experiences.append
         
         # Look for experience patterns in original text
         current_exp = None
         in_experience_section = False
         
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            
+        for line in parsed.lines:
             # Check for experience section headers
-            if re.match(r'(professional\s+)?experience|work\s+experience|employment', line.lower()):
+            if _EXP_HDR.match(line):
                 in_experience_section = True
                 continue
             
             # Check for other section headers that end experience
-            if re.match(r'education|skills|projects|certifications', line.lower()):
+            if _OTHER_HDR.match(line):
                 in_experience_section = False
                 continue
             
             if in_experience_section:
                 # Look for company names (usually in caps or bold indicators)
-                if line.isupper() or (len(line) < 50 and not line.startswith('•')):
+                if line.isupper() or (len(line) < 50 and line[0] not in _BULLET_CHARS):
                     if current_exp:
-                        experiences.append(current_exp)
+                        add_experience(Experience.from_builder(current_exp))
                     
                     current_exp = {
                         'company': line,
@@ -652,41 +1052,40 @@ class ATSResumeLayouts:
                 # Look for position titles and dates
                 elif current_exp and not current_exp['position']:
                     # Try to extract position and dates from line
-                    date_pattern = r'(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec|\d{4})'
-                    if re.search(date_pattern, line.lower()):
+                    if _DATE_PAT.search(line):
                         # Line contains dates
                         current_exp['dates'] = line
                     else:
                         current_exp['position'] = line
                 
                 # Look for bullet points
-                elif line.startswith('•') or line.startswith('-'):
+                elif line[0] in _BULLET_CHARS:
                     if current_exp:
-                        responsibility = line.lstrip('•- ').strip()
+                        responsibility = line.lstrip(_BULLET_LEAD).strip()
                         if responsibility:
                             current_exp['responsibilities'].append(responsibility)
         
         # Add last experience
         if current_exp:
-            experiences.append(current_exp)
+            add_experience(Experience.from_builder(current_exp))
         
         # If no experiences found, create template
         if not experiences:
             job_analysis = raw_data.get('job_analysis', {})
             target_title = job_analysis.get('job_title', 'Target Position')
             
-            experiences = [{
-                'company': 'Company Name',
-                'position': target_title,
-                'dates': 'Start Date - End Date',
-                'location': 'City, State',
-                'responsibilities': [
+            experiences = [Experience(
+                company='Company Name',
+                position=target_title,
+                dates='Start Date - End Date',
+                location='City, State',
+                responsibilities=(
                     'Developed and implemented solutions using relevant technologies',
                     'Collaborated with cross-functional teams to deliver high-quality results',
                     'Led initiatives that improved efficiency and system performance',
                     'Contributed to strategic planning and decision-making processes'
-                ]
-            }]
+                )
+            )]
         
         return experiences
     
@@ -703,68 +1102,36 @@ class ATSResumeLayouts:
         # Combine and categorize
         all_skills = resume_skills.union(job_skills)
         
-        # Skill categories
-        programming = []
-        frameworks = []
-        databases = []
-        cloud = []
-        other = []
-        
-        # Categorization logic
-        programming_keywords = ['python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'php', 'ruby', 'go', 'sql', 'html', 'css']
-        framework_keywords = ['react', 'angular', 'vue', 'nodejs', 'django', 'flask', 'spring', 'express', 'tailwind']
-        database_keywords = ['mysql', 'postgresql', 'mongodb', 'redis', 'sqlite', 'oracle']
-        cloud_keywords = ['aws', 'azure', 'gcp', 'docker', 'kubernetes', 'git', 'github']
+        categories = {category: [] for category in _SKILL_CATEGORIES}
         
         for skill in all_skills:
-            skill_lower = skill.lower()
-            if any(kw in skill_lower for kw in programming_keywords):
-                programming.append(skill)
-            elif any(kw in skill_lower for kw in framework_keywords):
-                frameworks.append(skill)
-            elif any(kw in skill_lower for kw in database_keywords):
-                databases.append(skill)
-            elif any(kw in skill_lower for kw in cloud_keywords):
-                cloud.append(skill)
-            else:
-                other.append(skill)
+            categories[_skill_category(skill)].append(skill)
         
-        return {
-            'programming': programming,
-            'frameworks': frameworks,
-            'databases': databases,
-            'cloud': cloud,
-            'other': other
-        }
+        return categories
     
-    def _extract_education(self, raw_data: Dict) -> List[Dict]:
+    def _extract_education(self, raw_data: Dict, parsed: ParsedResume) -> List[Dict]:
         """Extract education information"""
         
-        original_text = raw_data.get('original_resume_text', '')
-        lines = original_text.split('\n')
-        
         education = []
         in_education_section = False
         
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            
-            # Check for education section
-            if re.match(r'education|academic|qualifications', line.lower()):
+        for line in parsed.lines:
+            # Section headers switch the education scan on or off
+            prefix = line[:_EDU_PREFIX_LEN].lower()
+            if prefix.startswith(_EDU_OPENERS):
                 in_education_section = True
                 continue
-            
-            # Check for other sections
-            if re.match(r'experience|skills|projects', line.lower()):
+            if prefix.startswith(_EDU_CLOSERS):
+                # Education is one block; once it has produced degrees, the rest is other sections
+                if education:
+                    break
                 in_education_section = False
                 continue
             
             if in_education_section:
-                # Look for degree patterns
-                degree_pattern = r'(b\.?tech|bachelor|master|m\.?tech|phd|diploma)'
-                if re.search(degree_pattern, line.lower()):
+                # Look for degree names
+                line_lower = line.lower()
+                if any(token in line_lower for token in _DEGREE_TOKENS):
                     education.append({
                         'institution': 'University Name',
                         'degree': line,
@@ -804,76 +1171,34 @@ class ATSResumeLayouts:
         technical_skills = resume_analysis.get('technical_skills', [])
         top_skills = ', '.join(technical_skills[:3]) if technical_skills else 'software development'
         
-        summary = f"Results-driven professional with {experience_years}+ years of experience in {top_skills.lower()} and software development. "
-        summary += f"Proven track record of delivering high-quality solutions and driving organizational success. "
-        summary += f"Seeking to leverage technical expertise and problem-solving skills in a {job_title.lower()} role."
-        
-        return summary
+        return _summary(experience_years, top_skills, job_title)
     
     def _generate_text_version(self, data: Dict) -> str:
         """Generate plain text version of resume"""
         
-        text_parts = []
         personal_info = data['personal_info']
-        
-        # Header
-        if personal_info.get('name'):
-            text_parts.append(personal_info['name'].upper())
-            text_parts.append('=' * len(personal_info['name']))
-        
-        # Contact
-        contact_parts = []
-        for field in ['phone', 'email', 'linkedin', 'github']:
-            if personal_info.get(field):
-                contact_parts.append(personal_info[field])
-        
-        if contact_parts:
-            text_parts.append(' | '.join(contact_parts))
-            text_parts.append('')
-        
-        # Professional Summary
-        if data.get('professional_summary'):
-            text_parts.append('PROFESSIONAL SUMMARY')
-            text_parts.append('-' * 20)
-            text_parts.append(data['professional_summary'])
-            text_parts.append('')
-        
-        # Technical Skills
+        name = personal_info.get('name') or ''
         skills = data.get('skills', {})
-        if skills:
-            text_parts.append('TECHNICAL SKILLS')
-            text_parts.append('-' * 15)
-            for category, skill_list in skills.items():
-                if skill_list:
-                    text_parts.append(f"• {category.title()}: {', '.join(skill_list)}")
-            text_parts.append('')
-        
-        # Experience
-        experience = data.get('experience', [])
-        if experience:
-            text_parts.append('PROFESSIONAL EXPERIENCE')
-            text_parts.append('-' * 24)
-            for exp in experience:
-                text_parts.append(f"{exp.get('company', 'Company')}")
-                text_parts.append(f"{exp.get('position', 'Position')} | {exp.get('dates', 'Dates')}")
-                if exp.get('location'):
-                    text_parts.append(exp['location'])
-                
-                for resp in exp.get('responsibilities', []):
-                    text_parts.append(f"• {resp}")
-                text_parts.append('')
-        
-        # Education
-        education = data.get('education', [])
-        if education:
-            text_parts.append('EDUCATION')
-            text_parts.append('-' * 9)
-            for edu in education:
-                text_parts.append(f"{edu.get('institution', 'Institution')}")
-                text_parts.append(f"{edu.get('degree', 'Degree')} | {edu.get('year', 'Year')}")
-                text_parts.append('')
-        
-        return '\n'.join(text_parts)
+        text = _TEXT_TEMPLATE.render(
+            name=name.upper(),
+            name_rule='=' * len(name),
+            contact=_contact_parts(personal_info),
+            summary=data.get('professional_summary'),
+            skills=skills,
+            skill_rows=[
+                (_CATEGORY_LABELS.get(category) or category.title(), ', '.join(skill_list))
+                for category, skill_list in skills.items() if skill_list
+            ],
+            experience=[
+                (exp.company, exp.position, exp.dates, exp.location, exp.responsibilities)
+                for exp in data.get('experience', [])
+            ],
+            education=[
+                (edu.get('institution', 'Institution'), edu.get('degree', 'Degree'), edu.get('year', 'Year'))
+                for edu in data.get('education', [])
+            ]
+        )
+        return text[:-1]  # Every template line ends in a newline; drop the last one
 
 def get_available_layouts() -> Dict[str, str]:
     """Get available resume layouts with descriptions"""
@@ -882,3 +1207,19 @@ def get_available_layouts() -> Dict[str, str]:
         'tech_focused': 'Tech Focused - Emphasizes technical skills and achievements', 
         'classic_professional': 'Classic Professional - Traditional corporate resume format'
     }
+
+# Picklable per-layout builders for the worker pool
+def _build_modern_ats(data: Dict) -> bytes:
+    return ATSResumeLayouts()._render_modern_ats(data)
+
+def _build_tech_focused(data: Dict) -> bytes:
+    return ATSResumeLayouts()._render_tech_focused(data)
+
+def _build_classic_professional(data: Dict) -> bytes:
+    return ATSResumeLayouts()._render_classic_professional(data)
+
+_BATCH_BUILDERS = {
+    'modern_ats': _build_modern_ats,
+    'tech_focused': _build_tech_focused,
+    'classic_professional': _build_classic_professional
+}
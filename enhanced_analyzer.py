@@ -1,9 +1,97 @@
 # app/services/enhanced_analyzer.py
 import re
+import os
+import sys
+import copy
+import heapq
+import asyncio
+import atexit
+import hashlib
+import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Dict, Set, Tuple
-from collections import Counter
+from collections import Counter, OrderedDict
 import json
 
+logger = logging.getLogger(__name__)
+
+# Analyses kept per analyzer, keyed by a hash of the text so re-submitted documents skip the work
+_ANALYSIS_CACHE_SIZE = 256
+
+# Weights of each component in the overall match score
+_MATCH_WEIGHTS = {
+    'technical': 0.35,
+    'soft_skills': 0.15,
+    'experience': 0.20,
+    'education': 0.10,
+    'industry': 0.10,
+    'keywords': 0.10
+}
+
+# Education levels ranked for requirement matching, and the score each level earns a resume
+_EDU_LEVELS = {'associates': 1, 'bachelors': 2, 'masters': 3, 'phd': 4}
+_EDUCATION_SCORES = {'phd': 100, 'masters': 85, 'bachelors': 70, 'associates': 50}
+
+# Requirement match score indexed by [resume level][required level]; level 0 is unknown or none
+_EDU_MATCH_SCORES = tuple(
+    tuple(
+        100 if resume_level >= required_level
+        else 75 if resume_level == required_level - 1
+        else 50 if resume_level == required_level - 2
+        else 25
+        for required_level in range(5)
+    )
+    for resume_level in range(5)
+)
+
+# Related industries get partial credit
+_RELATED_INDUSTRIES = {
+    'technology': ('fintech', 'ai_ml', 'iot'),
+    'healthcare': ('fintech',),  # Some overlap in regulatory compliance
+    'finance': ('fintech',)
+}
+
+# Company size indicators, checked in order
+_COMPANY_SIZE_INDICATORS = {
+    'startup': ('startup', 'early stage', 'seed', 'series a'),
+    'small': ('small', 'growing', '10-50', '50-100'),
+    'medium': ('medium', '100-500', '500-1000'),
+    'large': ('large', 'enterprise', '1000+', 'fortune')
+}
+
+# Importance of commonly requested skills when ranking gaps; others rank at 3
+_SKILL_IMPORTANCE = {
+    # High importance skills
+    'python': 10, 'java': 10, 'javascript': 10, 'react': 9, 'aws': 9,
+    'sql': 9, 'git': 8, 'docker': 8, 'kubernetes': 8, 'node.js': 8,
+    # Medium importance skills
+    'angular': 7, 'vue': 7, 'django': 7, 'flask': 7, 'spring': 7,
+    # Lower importance but still relevant
+    'html': 5, 'css': 5, 'bootstrap': 4
+}
+
+# Job description patterns. The required-experience alternatives run as one scan: the lookahead
+# tests every offset so overlapping phrasings are all seen, and the digit-led alternatives skip
+# offsets inside a number, where a separate findall of each pattern would never start
+_REQUIRED_EXP_RE = re.compile(
+    r'(?='
+    r'(?<!\d)(\d+)[\+]?\s*(?:years?|yrs?)\s*(?:of\s*)?(?:experience|exp)'
+    r'|minimum\s*(\d+)\s*(?:years?|yrs?)'
+    r'|at least\s*(\d+)\s*(?:years?|yrs?)'
+    r'|(?<!\d)(\d+)[\+]?\s*(?:to|\-)\s*(\d+)\s*(?:years?|yrs?)'
+    r')'
+)
+_PHD_REQUIRED_RE = re.compile(r'phd.*required|doctorate.*required')
+_MASTERS_REQUIRED_RE = re.compile(r'master.*required|mba.*required')
+_BACHELORS_REQUIRED_RE = re.compile(r'bachelor.*required|degree.*required')
+# Complexity terms in one scan; the named group that fired says which factor to count
+_COMPLEXITY_RE = re.compile(
+    r'\b(?:(?P<required>required|must have|essential)'
+    r'|(?P<preferred>preferred|nice to have|bonus)'
+    r'|(?P<years>years?|yrs?))\b'
+)
+
 class EnhancedResumeAnalyzer:
     """
     Advanced resume and job analysis with enhanced skill detection,
@@ -13,6 +101,27 @@ class EnhancedResumeAnalyzer:
     def __init__(self):
         self._initialize_skill_databases()
         self._initialize_analysis_patterns()
+        self._analysis_cache = OrderedDict()
+        self._analysis_cache_lock = threading.Lock()
+    
+    def _cached_analysis(self, kind: str, text: str, analyze) -> Dict:
+        """Return a copy of the memoized analysis of text, running analyze on a miss"""
+        key = (kind, hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest())
+        
+        with self._analysis_cache_lock:
+            result = self._analysis_cache.get(key)
+            if result is not None:
+                self._analysis_cache.move_to_end(key)
+        
+        if result is None:
+            result = analyze(text)
+            with self._analysis_cache_lock:
+                self._analysis_cache[key] = result
+                if len(self._analysis_cache) > _ANALYSIS_CACHE_SIZE:
+                    self._analysis_cache.popitem(last=False)
+        
+        # Callers are free to modify what they get back, so the cached copy is never handed out
+        return copy.deepcopy(result)
     
     def _initialize_skill_databases(self):
         """Initialize comprehensive skill databases by category"""
@@ -92,18 +201,55 @@ class EnhancedResumeAnalyzer:
             'ai_ml': ['machine learning', 'deep learning', 'neural networks', 'computer vision', 'nlp', 'reinforcement learning', 'mlops', 'model deployment']
         }
         
-        # Combine all technical skills
-        self.all_technical_skills = (
-            self.programming_languages + self.frameworks_libraries + self.databases + 
-            self.cloud_devops + self.tools_technologies + self.methodologies
+        # Combine all technical skills, industry-specific ones included, keeping the first
+        # spelling of each skill in order. Skill strings are interned so every analysis
+        # reports the same string objects and set operations on them compare by identity
+        unique_skills = {}
+        for collection in (
+            self.programming_languages, self.frameworks_libraries, self.databases,
+            self.cloud_devops, self.tools_technologies, self.methodologies,
+            *self.industry_skills.values()
+        ):
+            for skill in collection:
+                unique_skills.setdefault(sys.intern(skill.lower()), sys.intern(skill))
+        self.all_technical_skills = list(unique_skills.values())
+        self.soft_skills = [sys.intern(skill) for skill in self.soft_skills]
+        
+        # (lowercased, reported) pairs in report order, and lowercased membership sets
+        self._tech_skill_keys = tuple(unique_skills.items())
+        self._soft_skill_keys = tuple((sys.intern(skill.lower()), skill) for skill in self.soft_skills)
+        self._all_tech_set = frozenset(unique_skills)
+        self._soft_skills_set = frozenset(key for key, skill in self._soft_skill_keys)
+        
+        # Industry keywords ending in a symbol ('c++', 'c#') can never satisfy the scanner's
+        # closing \b, so industry detection keeps a plain substring test for them
+        self._symbol_industry_keywords = frozenset(
+            keyword for keywords in self.industry_skills.values() for keyword in keywords
+            if not re.search(r'\w$', keyword)
         )
         
-        # Add industry-specific skills
-        for industry_skills in self.industry_skills.values():
-            self.all_technical_skills.extend(industry_skills)
+        self._build_skill_scanner()
+    
+    def _build_skill_scanner(self):
+        """Compile one multi-skill scanner over every technical and soft skill"""
+        
+        # Longest first, so at each word boundary the scanner reports the longest skill that fits
+        vocabulary = sorted(
+            self._all_tech_set | self._soft_skills_set,
+            key=len, reverse=True
+        )
+        self._skill_scanner = re.compile(
+            r'\b(?=(' + '|'.join(re.escape(skill) + r'\b' for skill in vocabulary) + '))'
+        )
         
-        # Remove duplicates while preserving order
-        self.all_technical_skills = list(dict.fromkeys(self.all_technical_skills))
+        # Shorter skills that can start at the same position ('spring' inside 'spring boot')
+        self._skill_prefixes = {
+            skill: tuple(
+                (prefix, re.compile(re.escape(prefix) + r'\b'))
+                for prefix in vocabulary if prefix != skill and skill.startswith(prefix)
+            )
+            for skill in vocabulary
+        }
     
     def _initialize_analysis_patterns(self):
         """Initialize regex patterns for various analysis tasks"""
@@ -118,6 +264,10 @@ class EnhancedResumeAnalyzer:
             r'more than\s*(\d+)\s*(?:years?|yrs?)'
         ]
         
+        # All experience patterns in one scan. The lookahead tests every offset, so numbers a
+        # separate per-pattern findall would have reached are still seen where matches overlap
+        self._experience_re = re.compile('(?=' + '|'.join(f'(?:{p})' for p in self.experience_patterns) + ')')
+        
         # Education patterns
         self.education_patterns = {
             'phd': [r'\bphd\b', r'\bph\.d\b', r'\bdoctorate\b', r'\bdoctoral\b'],
@@ -126,6 +276,12 @@ class EnhancedResumeAnalyzer:
             'associates': [r'\bassociate[\'s]?\b', r'\bas\b', r'\ba\.s\b', r'\bdiploma\b']
         }
         
+        # One compiled alternation per education level, checked in priority order
+        self._education_res = {
+            level: re.compile('|'.join(f'(?:{p})' for p in patterns), re.IGNORECASE)
+            for level, patterns in self.education_patterns.items()
+        }
+        
         # Contact information patterns
         self.contact_patterns = {
             'email': r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
@@ -133,6 +289,32 @@ class EnhancedResumeAnalyzer:
             'linkedin': r'linkedin\.com/(?:in/)?([A-Za-z0-9-]+)',
             'github': r'github\.com/([A-Za-z0-9-]+)'
         }
+        self._contact_res = {contact_type: re.compile(pattern) for contact_type, pattern in self.contact_patterns.items()}
+        
+        # Literal each contact pattern needs, and whether a match starts with it; a str.find for
+        # the literal skips the regex entirely when it is absent
+        self._contact_literals = {
+            'email': ('@', False),
+            'linkedin': ('linkedin.com/', True),
+            'github': ('github.com/', True)
+        }
+        
+        # Content quality and keyword patterns
+        self._number_re = re.compile(r'\d+(?:\.\d+)?[%kmb$€£]')
+        # Whole words, tokenized once and shared by keyword extraction and the action-verb count
+        self._word_re = re.compile(r'\b[a-zA-Z]+\b')
+        
+        self.action_verbs = frozenset([
+            'achieved', 'administered', 'analyzed', 'architected', 'automated', 'built', 'collaborated',
+            'created', 'delivered', 'designed', 'developed', 'directed', 'enhanced', 'established',
+            'executed', 'implemented', 'improved', 'increased', 'led', 'managed', 'optimized',
+            'organized', 'pioneered', 'reduced', 'resolved', 'spearheaded', 'streamlined'
+        ])
+        
+        self.stop_words = frozenset([
+            'the', 'and', 'for', 'are', 'with', 'this', 'that', 'have', 'from', 'they', 'been',
+            'will', 'would', 'could', 'should', 'may', 'might', 'must', 'can', 'shall'
+        ])
         
         # Job level indicators
         self.job_level_patterns = {
@@ -148,20 +330,26 @@ class EnhancedResumeAnalyzer:
         if not resume_text or len(resume_text.strip()) < 50:
             raise ValueError("Resume text is too short or empty for meaningful analysis")
         
+        return self._cached_analysis('resume', resume_text, self._analyze_resume)
+    
+    def _analyze_resume(self, resume_text: str) -> Dict:
+        """Run the full resume analysis"""
         resume_lower = resume_text.lower()
         
-        print("🔍 Performing comprehensive resume analysis...")
+        logger.debug("🔍 Performing comprehensive resume analysis...")
         
-        # Basic analysis
+        # Basic analysis; the word count is shared with the ATS check
+        word_count = len(resume_text.split())
         basic_analysis = {
-            'word_count': len(resume_text.split()),
+            'word_count': word_count,
             'character_count': len(resume_text),
-            'line_count': len([line for line in resume_text.split('\n') if line.strip()]),
-            'paragraph_count': len([p for p in resume_text.split('\n\n') if p.strip()])
+            'line_count': sum(1 for line in resume_text.split('\n') if line.strip()),
+            'paragraph_count': sum(1 for p in resume_text.split('\n\n') if p.strip())
         }
         
         # Skills analysis
-        skills_analysis = self._analyze_skills(resume_lower)
+        found_skills = self._scan_skills(resume_lower)
+        skills_analysis = self._analyze_skills(resume_lower, found_skills)
         
         # Experience analysis
         experience_analysis = self._analyze_experience(resume_lower)
@@ -173,13 +361,14 @@ class EnhancedResumeAnalyzer:
         contact_analysis = self._analyze_contact_info(resume_text)
         
         # Content quality analysis
-        quality_analysis = self._analyze_content_quality(resume_text)
+        words = self._word_re.findall(resume_lower)
+        quality_analysis = self._analyze_content_quality(resume_text, resume_lower, words)
         
         # Keywords extraction
-        keywords = self._extract_advanced_keywords(resume_text)
+        keywords = self._extract_advanced_keywords(resume_text, resume_lower, words)
         
         # Industry detection
-        industry = self._detect_industry(resume_lower)
+        industry = self._detect_industry(resume_lower, found_skills)
         
         # Combine all analysis results
         analysis_result = {
@@ -191,10 +380,10 @@ class EnhancedResumeAnalyzer:
             'quality_metrics': quality_analysis,
             'keywords': keywords,
             'detected_industry': industry,
-            'ats_compatibility_score': self._calculate_ats_compatibility(resume_text)
+            'ats_compatibility_score': self._calculate_ats_compatibility(resume_text, resume_lower, word_count)
         }
         
-        print(f"✅ Resume analysis complete - {len(skills_analysis['technical_skills'])} technical skills found")
+        logger.debug("✅ Resume analysis complete - %d technical skills found", len(skills_analysis['technical_skills']))
         
         return analysis_result
     
@@ -205,27 +394,32 @@ class EnhancedResumeAnalyzer:
         if not job_text or len(job_text.strip()) < 50:
             raise ValueError("Job description is too short for meaningful analysis")
         
+        return self._cached_analysis('job', job_text, self._analyze_job_description)
+    
+    def _analyze_job_description(self, job_text: str) -> Dict:
+        """Run the full job description analysis"""
         job_lower = job_text.lower()
         
-        print("💼 Analyzing job description requirements...")
+        logger.debug("💼 Analyzing job description requirements...")
         
         # Skills analysis
-        skills_analysis = self._analyze_skills(job_lower)
+        found_skills = self._scan_skills(job_lower)
+        skills_analysis = self._analyze_skills(job_lower, found_skills)
         
         # Requirements analysis
         requirements_analysis = self._analyze_job_requirements(job_lower)
         
         # Company analysis
-        company_analysis = self._analyze_company_info(job_text)
+        company_analysis = self._analyze_company_info(job_text, job_lower)
         
         # Urgency and priority analysis
         urgency_analysis = self._analyze_job_urgency(job_lower)
         
         # Keywords extraction
-        keywords = self._extract_advanced_keywords(job_text)
+        keywords = self._extract_advanced_keywords(job_text, job_lower)
         
         # Industry detection
-        industry = self._detect_industry(job_lower)
+        industry = self._detect_industry(job_lower, found_skills)
         
         analysis_result = {
             **skills_analysis,
@@ -234,32 +428,51 @@ class EnhancedResumeAnalyzer:
             **urgency_analysis,
             'keywords': keywords,
             'industry': industry,
-            'job_complexity_score': self._calculate_job_complexity(job_text)
+            'job_complexity_score': self._calculate_job_complexity(job_text, job_lower)
         }
         
-        print(f"✅ Job analysis complete - {analysis_result['job_level']} position requiring {len(skills_analysis['technical_skills'])} technical skills")
+        logger.debug("✅ Job analysis complete - %s position requiring %d technical skills",
+                     analysis_result['job_level'], len(skills_analysis['technical_skills']))
         
         return analysis_result
     
+    def analyze_many(self, texts: List[str], kind: str = 'resume') -> List[Dict]:
+        """
+        Analyze a batch of resumes (kind='resume') or job descriptions (kind='job')
+        in parallel worker processes, returning results in input order
+        """
+        worker = _BATCH_WORKERS.get(kind)
+        if worker is None:
+            raise ValueError(f"Unknown analysis kind {kind!r}; expected one of {sorted(_BATCH_WORKERS)}")
+        return list(_get_analysis_pool().map(worker, texts, chunksize=8))
+    
+    async def analyze_many_async(self, texts: List[str], kind: str = 'resume') -> List[Dict]:
+        """
+        Batch analysis that waits on the worker pool without blocking the event loop
+        """
+        return await asyncio.to_thread(self.analyze_many, texts, kind)
+    
     def calculate_advanced_match_score(self, resume_analysis: Dict, job_analysis: Dict) -> Dict:
         """
         Advanced matching algorithm with weighted scoring
         """
-        print("🎯 Calculating advanced compatibility scores...")
+        logger.debug("🎯 Calculating advanced compatibility scores...")
         
-        # Get skill sets
-        resume_tech = set(resume_analysis.get('technical_skills', []))
+        # Get skill sets; only the job side needs a set, the resume lists are probed against it
+        resume_tech = resume_analysis.get('technical_skills', [])
         job_tech = set(job_analysis.get('technical_skills', []))
         
-        resume_soft = set(resume_analysis.get('soft_skills', []))
+        resume_soft = resume_analysis.get('soft_skills', [])
         job_soft = set(job_analysis.get('soft_skills', []))
         
         # Technical skills matching
-        tech_matches = resume_tech.intersection(job_tech)
+        tech_matches = job_tech.intersection(resume_tech)
+        missing_tech = job_tech.difference(resume_tech)
         tech_score = (len(tech_matches) / len(job_tech) * 100) if job_tech else 100
         
         # Soft skills matching
-        soft_matches = resume_soft.intersection(job_soft)
+        soft_matches = job_soft.intersection(resume_soft)
+        missing_soft = job_soft.difference(resume_soft)
         soft_score = (len(soft_matches) / len(job_soft) * 100) if job_soft else 100
         
         # Experience level matching
@@ -280,24 +493,15 @@ class EnhancedResumeAnalyzer:
         )
         
         # Keywords overlap
-        resume_keywords = set(resume_analysis.get('keywords', []))
         job_keywords = set(job_analysis.get('keywords', []))
-        keyword_matches = resume_keywords.intersection(job_keywords)
+        keyword_matches = job_keywords.intersection(resume_analysis.get('keywords', []))
         keyword_score = (len(keyword_matches) / len(job_keywords) * 100) if job_keywords else 0
         
         # ATS compatibility factor
         ats_factor = resume_analysis.get('ats_compatibility_score', 0) / 100
         
         # Weighted overall score
-        weights = {
-            'technical': 0.35,
-            'soft_skills': 0.15,
-            'experience': 0.20,
-            'education': 0.10,
-            'industry': 0.10,
-            'keywords': 0.10
-        }
-        
+        weights = _MATCH_WEIGHTS
         weighted_score = (
             tech_score * weights['technical'] +
             soft_score * weights['soft_skills'] +
@@ -323,9 +527,9 @@ class EnhancedResumeAnalyzer:
             
             # Detailed matches and gaps
             'matched_technical_skills': list(tech_matches),
-            'missing_technical_skills': list(job_tech - resume_tech),
+            'missing_technical_skills': list(missing_tech),
             'matched_soft_skills': list(soft_matches),
-            'missing_soft_skills': list(job_soft - resume_soft),
+            'missing_soft_skills': list(missing_soft),
             'matched_keywords': list(keyword_matches),
             
             # Combined matched skills for display
@@ -337,13 +541,13 @@ class EnhancedResumeAnalyzer:
             
             # Match strength indicators
             'match_strength': self._categorize_match_strength(final_score),
-            'top_skill_gaps': self._identify_top_skill_gaps(job_tech - resume_tech, job_analysis),
+            'top_skill_gaps': self._identify_top_skill_gaps(missing_tech, job_analysis),
             
             # Scoring weights used
-            'scoring_weights': weights
+            'scoring_weights': dict(weights)
         }
         
-        print(f"✅ Match analysis complete - Overall score: {match_result['overall_score']}%")
+        logger.debug("✅ Match analysis complete - Overall score: %s%%", match_result['overall_score'])
         
         return match_result
     
@@ -440,37 +644,38 @@ class EnhancedResumeAnalyzer:
         return suggestions[:10]
     
     # Helper methods for analysis
-    def _analyze_skills(self, text: str) -> Dict:
+    def _scan_skills(self, text: str) -> set:
+        """Single pass over the text that finds every whole-word skill occurrence"""
+        found = set()
+        for match in self._skill_scanner.finditer(text):
+            skill = match.group(1)
+            found.add(skill)
+            for prefix, pattern in self._skill_prefixes[skill]:
+                if pattern.match(text, match.start()):
+                    found.add(prefix)
+        
+        return found
+    
+    def _analyze_skills(self, text: str, found: set = None) -> Dict:
         """Analyze and categorize skills found in text"""
-        found_technical = []
-        found_soft = []
-        
-        # Technical skills detection with context awareness
-        for skill in self.all_technical_skills:
-            pattern = r'\b' + re.escape(skill.lower()) + r'\b'
-            if re.search(pattern, text):
-                found_technical.append(skill)
-        
-        # Soft skills detection
-        for skill in self.soft_skills:
-            pattern = r'\b' + re.escape(skill.lower()) + r'\b'
-            if re.search(pattern, text):
-                found_soft.append(skill)
+        if found is None:
+            found = self._scan_skills(text)
         
+        # Only walk a list to restore its order when the scan hit a skill from it
         return {
-            'technical_skills': found_technical,
-            'soft_skills': found_soft
+            'technical_skills': [skill for key, skill in self._tech_skill_keys if key in found]
+                                if not self._all_tech_set.isdisjoint(found) else [],
+            'soft_skills': [skill for key, skill in self._soft_skill_keys if key in found]
+                           if not self._soft_skills_set.isdisjoint(found) else []
         }
     
     def _analyze_experience(self, text: str) -> Dict:
         """Extract and analyze experience information"""
-        years = []
-        
-        for pattern in self.experience_patterns:
-            matches = re.findall(pattern, text)
-            years.extend([int(match) for match in matches if match.isdigit()])
-        
-        experience_years = max(years) if years else 0
+        # Every captured group is a run of digits, so it converts without checks
+        experience_years = max(
+            (int(group) for match in self._experience_re.finditer(text) for group in match.groups() if group),
+            default=0
+        )
         
         return {
             'experience_years': experience_years,
@@ -483,13 +688,10 @@ class EnhancedResumeAnalyzer:
         education_score = 0
         
         # Check for education levels in priority order
-        for level, patterns in self.education_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, text, re.IGNORECASE):
-                    education_level = level
-                    education_score = {'phd': 100, 'masters': 85, 'bachelors': 70, 'associates': 50}.get(level, 0)
-                    break
-            if education_level:
+        for level, pattern in self._education_res.items():
+            if pattern.search(text):
+                education_level = level
+                education_score = _EDUCATION_SCORES.get(level, 0)
                 break
         
         return {
@@ -501,29 +703,36 @@ class EnhancedResumeAnalyzer:
         """Extract contact information"""
         contact_info = {}
         
-        for contact_type, pattern in self.contact_patterns.items():
-            matches = re.findall(pattern, text)
-            if matches:
-                contact_info[contact_type] = matches[0] if isinstance(matches[0], str) else matches[0]
+        for contact_type, pattern in self._contact_res.items():
+            start = 0
+            literal = self._contact_literals.get(contact_type)
+            if literal:
+                position = text.find(literal[0])
+                if position < 0:
+                    continue
+                if literal[1]:
+                    start = position
+            
+            # First match, reported the way findall would: the captured group when there is one
+            match = pattern.search(text, start)
+            if match:
+                contact_info[contact_type] = (match.group(1) or '') if pattern.groups else match.group()
         
         return contact_info
     
-    def _analyze_content_quality(self, text: str) -> Dict:
+    def _analyze_content_quality(self, text: str, text_lower: str = None, words: List[str] = None) -> Dict:
         """Analyze resume content quality"""
+        if text_lower is None:
+            text_lower = text.lower()
+        if words is None:
+            words = self._word_re.findall(text_lower)
         
         # Quantification analysis
-        numbers = re.findall(r'\d+(?:\.\d+)?(?:%|k|m|b|\$|€|£)', text.lower())
+        numbers = self._number_re.findall(text_lower)
         quantification_score = min(100, len(numbers) * 10)
         
         # Action verbs analysis
-        action_verbs = [
-            'achieved', 'administered', 'analyzed', 'architected', 'automated', 'built', 'collaborated',
-            'created', 'delivered', 'designed', 'developed', 'directed', 'enhanced', 'established',
-            'executed', 'implemented', 'improved', 'increased', 'led', 'managed', 'optimized',
-            'organized', 'pioneered', 'reduced', 'resolved', 'spearheaded', 'streamlined'
-        ]
-        
-        action_verb_count = sum(1 for verb in action_verbs if verb in text.lower())
+        action_verb_count = len(self.action_verbs.intersection(words))
         action_verb_score = min(100, action_verb_count * 5)
         
         # Overall quality score
@@ -537,31 +746,32 @@ class EnhancedResumeAnalyzer:
             'action_verbs_found': action_verb_count
         }
     
-    def _extract_advanced_keywords(self, text: str) -> List[str]:
+    def _extract_advanced_keywords(self, text: str, text_lower: str = None, words: List[str] = None) -> List[str]:
         """Extract relevant keywords with frequency analysis"""
-        # Tokenize and clean
-        words = re.findall(r'\b[a-zA-Z]{3,}\b', text.lower())
+        if words is None:
+            words = self._word_re.findall(text.lower() if text_lower is None else text_lower)
         
-        # Filter stop words
-        stop_words = {
-            'the', 'and', 'for', 'are', 'with', 'this', 'that', 'have', 'from', 'they', 'been',
-            'will', 'would', 'could', 'should', 'may', 'might', 'must', 'can', 'shall'
-        }
-        
-        filtered_words = [word for word in words if word not in stop_words and len(word) > 3]
-        
-        # Count frequencies
-        word_freq = Counter(filtered_words)
+        # Filter short and stop words, count frequencies
+        stop_words = self.stop_words
+        word_freq = Counter(word for word in words if len(word) > 3 and word not in stop_words)
         
         # Return top keywords
         return [word for word, freq in word_freq.most_common(20)]
     
-    def _detect_industry(self, text: str) -> str:
+    def _detect_industry(self, text: str, found: set = None) -> str:
         """Detect industry based on keywords"""
+        if found is None:
+            found = self._scan_skills(text)
+        
         industry_scores = {}
         
+        # Industry keywords are part of the skill vocabulary, so the skill scan already has them
+        symbol_keywords = self._symbol_industry_keywords
         for industry, keywords in self.industry_skills.items():
-            score = sum(1 for keyword in keywords if keyword in text)
+            score = sum(
+                1 for keyword in keywords
+                if keyword in found or (keyword in symbol_keywords and keyword in text)
+            )
             if score > 0:
                 industry_scores[industry] = score
         
@@ -578,21 +788,25 @@ class EnhancedResumeAnalyzer:
         else:
             return 'general'
     
-    def _calculate_ats_compatibility(self, text: str) -> float:
+    def _calculate_ats_compatibility(self, text: str, text_lower: str = None, word_count: int = None) -> float:
         """Calculate ATS compatibility score"""
+        if text_lower is None:
+            text_lower = text.lower()
+        if word_count is None:
+            word_count = len(text.split())
+        
         score = 100.0
         
         # Penalize for problematic elements
-        if re.search(r'[^\x00-\x7F]', text):  # Non-ASCII characters
+        if not text.isascii():  # Non-ASCII characters
             score -= 10
         
         # Check for standard section headers
         standard_sections = ['experience', 'education', 'skills', 'summary']
-        found_sections = sum(1 for section in standard_sections if section in text.lower())
+        found_sections = sum(1 for section in standard_sections if section in text_lower)
         section_score = (found_sections / len(standard_sections)) * 20
         
         # Length check
-        word_count = len(text.split())
         if word_count < 300:
             score -= 15
         elif word_count > 800:
@@ -624,23 +838,10 @@ class EnhancedResumeAnalyzer:
     
     def _extract_required_experience(self, text: str) -> int:
         """Extract required years of experience"""
-        patterns = [
-            r'(\d+)[\+]?\s*(?:years?|yrs?)\s*(?:of\s*)?(?:experience|exp)',
-            r'minimum\s*(\d+)\s*(?:years?|yrs?)',
-            r'at least\s*(\d+)\s*(?:years?|yrs?)',
-            r'(\d+)[\+]?\s*(?:to|\-)\s*(\d+)\s*(?:years?|yrs?)'
-        ]
-        
-        years = []
-        for pattern in patterns:
-            matches = re.findall(pattern, text)
-            for match in matches:
-                if isinstance(match, tuple):
-                    years.extend([int(m) for m in match if m.isdigit()])
-                elif match.isdigit():
-                    years.append(int(match))
-        
-        return min(years) if years else 0
+        return min(
+            (int(group) for match in _REQUIRED_EXP_RE.finditer(text) for group in match.groups() if group),
+            default=0
+        )
     
     def _determine_job_level(self, text: str) -> str:
         """Determine job level from description"""
@@ -654,35 +855,29 @@ class EnhancedResumeAnalyzer:
     def _extract_education_requirements(self, text: str) -> str:
         """Extract education requirements"""
         
-        if re.search(r'phd.*required|doctorate.*required', text):
+        if _PHD_REQUIRED_RE.search(text):
             return 'phd'
-        elif re.search(r'master.*required|mba.*required', text):
+        elif _MASTERS_REQUIRED_RE.search(text):
             return 'masters'
-        elif re.search(r'bachelor.*required|degree.*required', text):
+        elif _BACHELORS_REQUIRED_RE.search(text):
             return 'bachelors'
         
         return None
     
-    def _analyze_company_info(self, text: str) -> Dict:
+    def _analyze_company_info(self, text: str, text_lower: str = None) -> Dict:
         """Analyze company information from job posting"""
-        
-        # Company size indicators
-        size_indicators = {
-            'startup': ['startup', 'early stage', 'seed', 'series a'],
-            'small': ['small', 'growing', '10-50', '50-100'],
-            'medium': ['medium', '100-500', '500-1000'],
-            'large': ['large', 'enterprise', '1000+', 'fortune']
-        }
+        if text_lower is None:
+            text_lower = text.lower()
         
         company_size = 'unknown'
-        for size, indicators in size_indicators.items():
-            if any(indicator in text.lower() for indicator in indicators):
+        for size, indicators in _COMPANY_SIZE_INDICATORS.items():
+            if any(indicator in text_lower for indicator in indicators):
                 company_size = size
                 break
         
         return {
             'company_size': company_size,
-            'is_remote_friendly': 'remote' in text.lower()
+            'is_remote_friendly': 'remote' in text_lower
         }
     
     def _analyze_job_urgency(self, text: str) -> Dict:
@@ -699,13 +894,17 @@ class EnhancedResumeAnalyzer:
             'competitive_position': competitive
         }
     
-    def _calculate_job_complexity(self, text: str) -> float:
+    def _calculate_job_complexity(self, text: str, text_lower: str = None) -> float:
         """Calculate job complexity score"""
+        if text_lower is None:
+            text_lower = text.lower()
+        
+        counts = Counter(match.lastgroup for match in _COMPLEXITY_RE.finditer(text_lower))
         
         complexity_factors = [
-            len(re.findall(r'\b(?:required|must have|essential)\b', text.lower())),
-            len(re.findall(r'\b(?:preferred|nice to have|bonus)\b', text.lower())),
-            len(re.findall(r'\b(?:years?|yrs?)\b', text.lower())),
+            counts['required'],
+            counts['preferred'],
+            counts['years'],
             len(text.split()) / 50  # Length factor
         ]
         
@@ -733,19 +932,7 @@ class EnhancedResumeAnalyzer:
         if not required_edu:
             return 100
         
-        education_levels = {'associates': 1, 'bachelors': 2, 'masters': 3, 'phd': 4}
-        
-        resume_level = education_levels.get(resume_edu, 0)
-        required_level = education_levels.get(required_edu, 0)
-        
-        if resume_level >= required_level:
-            return 100
-        elif resume_level == required_level - 1:
-            return 75
-        elif resume_level == required_level - 2:
-            return 50
-        else:
-            return 25
+        return _EDU_MATCH_SCORES[_EDU_LEVELS.get(resume_edu, 0)][_EDU_LEVELS.get(required_edu, 0)]
     
     def _calculate_industry_alignment(self, resume_industry: str, job_industry: str) -> float:
         """Calculate industry alignment score"""
@@ -755,14 +942,7 @@ class EnhancedResumeAnalyzer:
         if resume_industry == job_industry:
             return 100
         
-        # Related industries get partial credit
-        related_industries = {
-            'technology': ['fintech', 'ai_ml', 'iot'],
-            'healthcare': ['fintech'],  # Some overlap in regulatory compliance
-            'finance': ['fintech']
-        }
-        
-        if job_industry in related_industries.get(resume_industry, []):
+        if job_industry in _RELATED_INDUSTRIES.get(resume_industry, ()):
             return 80
         
         return 50  # Different industries
@@ -794,22 +974,49 @@ class EnhancedResumeAnalyzer:
         if not missing_skills:
             return []
         
-        # Prioritize based on frequency in job posting and skill importance
-        skill_importance = {
-            # High importance skills
-            'python': 10, 'java': 10, 'javascript': 10, 'react': 9, 'aws': 9,
-            'sql': 9, 'git': 8, 'docker': 8, 'kubernetes': 8, 'node.js': 8,
-            # Medium importance skills
-            'angular': 7, 'vue': 7, 'django': 7, 'flask': 7, 'spring': 7,
-            # Lower importance but still relevant
-            'html': 5, 'css': 5, 'bootstrap': 4
-        }
-        
-        # Sort missing skills by importance
-        sorted_skills = sorted(
-            missing_skills,
-            key=lambda skill: skill_importance.get(skill, 3),
-            reverse=True
-        )
-        
-        return sorted_skills[:5]
+        # Top five missing skills by importance, ties kept in their original order
+        return heapq.nlargest(5, missing_skills, key=lambda skill: _SKILL_IMPORTANCE.get(skill, 3))
+
+
+# Shared analyzer, so the skill databases and compiled patterns are built once per process
+_ANALYZER = None
+_ANALYZER_LOCK = threading.Lock()
+
+def get_analyzer() -> EnhancedResumeAnalyzer:
+    """Create the shared analyzer on first use"""
+    global _ANALYZER
+    if _ANALYZER is None:
+        with _ANALYZER_LOCK:
+            if _ANALYZER is None:
+                _ANALYZER = EnhancedResumeAnalyzer()
+    return _ANALYZER
+
+# Worker processes each build their own shared analyzer once, when the pool starts them
+_ANALYSIS_POOL = None
+_ANALYSIS_POOL_LOCK = threading.Lock()
+
+def _get_analysis_pool() -> ProcessPoolExecutor:
+    """Create the batch analysis worker pool on first use"""
+    global _ANALYSIS_POOL
+    if _ANALYSIS_POOL is None:
+        with _ANALYSIS_POOL_LOCK:
+            if _ANALYSIS_POOL is None:
+                _ANALYSIS_POOL = ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=get_analyzer)
+                atexit.register(_shutdown_analysis_pool)
+    return _ANALYSIS_POOL
+
+def _shutdown_analysis_pool() -> None:
+    """Stop the batch analysis worker pool; registered with atexit when the pool starts"""
+    global _ANALYSIS_POOL
+    with _ANALYSIS_POOL_LOCK:
+        pool, _ANALYSIS_POOL = _ANALYSIS_POOL, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+def _analyze_resume_in_worker(resume_text: str) -> Dict:
+    return get_analyzer().analyze_resume(resume_text)
+
+def _analyze_job_in_worker(job_text: str) -> Dict:
+    return get_analyzer().analyze_job_description(job_text)
+
+_BATCH_WORKERS = {'resume': _analyze_resume_in_worker, 'job': _analyze_job_in_worker}
@@ -16,12 +16,12 @@ logger = logging.getLogger(__name__)
 
 # Import core services
 from app.services.pdf_extractor import PDFExtractor
-from app.services.enhanced_analyzer import EnhancedResumeAnalyzer
+from app.services.enhanced_analyzer import get_analyzer
 
 # Import AI services with error handling
 try:
     from app.services.perplexity_analyzer import PerplexityJobAnalyzer
-    from app.services.ai_resume_generator import AIEnhancedResumeGenerator
+    from app.services.ai_resume_generator import get_generator as get_ai_resume_generator
     AI_SERVICES_AVAILABLE = True
 except ImportError as e:
     logger.warning(f"AI services not available: {e}")
@@ -50,7 +50,7 @@ templates = Jinja2Templates(directory="app/templates")
 
 # Initialize core services (always available)
 pdf_extractor = PDFExtractor()
-analyzer = EnhancedResumeAnalyzer()
+analyzer = get_analyzer()
 
 # Initialize HTML Resume Generator
 html_generator = None
@@ -70,7 +70,7 @@ ai_services_active = False
 if AI_SERVICES_AVAILABLE and PERPLEXITY_API_KEY:
     try:
         perplexity_analyzer = PerplexityJobAnalyzer(PERPLEXITY_API_KEY)
-        ai_resume_generator = AIEnhancedResumeGenerator()
+        ai_resume_generator = get_ai_resume_generator()
         ai_services_active = True
         logger.info("✅ AI services initialized - Perplexity integration ACTIVE")
     except Exception as e:
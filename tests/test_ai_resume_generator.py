@@ -0,0 +1,98 @@
+import pytest
+
+from ai_resume_generator import AIEnhancedResumeGenerator
+
+
+def _personal_info(text):
+    return AIEnhancedResumeGenerator()._extract_enhanced_personal_info(text, {})
+
+
+def test_linkedin_url_does_not_swallow_location():
+    info = _personal_info("linkedin.com/in/jane, NY\nhttps://x.io")
+    
+    assert info['linkedin'] == 'linkedin.com/in/jane'
+    assert info['location'] == 'jane, NY'
+    assert info['portfolio'] == 'https://x.io'
+
+
+def test_name_after_many_blank_lines():
+    info = _personal_info("\n" * 60 + "  Jane Doe \r\nfoo\nbar")
+    
+    assert info['name'] == 'Jane Doe'
+
+
+def test_name_defaults_for_blank_text():
+    assert _personal_info(" \n\t\n")['name'] == 'Professional Name'
+
+
+def test_write_atomic_uses_umask_mode(tmp_path, monkeypatch):
+    import ai_resume_generator
+    
+    monkeypatch.setattr(ai_resume_generator, '_OUT_DIR', str(tmp_path))
+    target = tmp_path / 'resume.pdf'
+    ai_resume_generator._write_atomic(str(target), b'%PDF-1.4')
+    
+    assert target.read_bytes() == b'%PDF-1.4'
+    assert [path.name for path in tmp_path.iterdir()] == ['resume.pdf']
+    
+    # Same mode a plain open() gives under the current umask
+    reference = tmp_path / 'reference.pdf'
+    reference.write_bytes(b'')
+    assert target.stat().st_mode & 0o777 == reference.stat().st_mode & 0o777
+
+
+def test_write_atomic_removes_temp_file_when_write_fails(tmp_path, monkeypatch):
+    import ai_resume_generator
+    
+    monkeypatch.setattr(ai_resume_generator, '_OUT_DIR', str(tmp_path))
+    
+    with pytest.raises(TypeError):
+        ai_resume_generator._write_atomic(str(tmp_path / 'resume.pdf'), 'not bytes')
+    
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_async_generation_matches_sync():
+    import asyncio
+    
+    generator = AIEnhancedResumeGenerator()
+    text = "Jane Doe\njane@example.com | Austin, TX\nPython engineer building Django services"
+    args = (text, {}, {}, {}, {'professional_summary': 'Backend engineer'})
+    text_only = frozenset({'text'})
+    
+    expected = generator.generate_ai_optimized_resume(*args, formats=text_only)
+    result = asyncio.run(generator.generate_ai_optimized_resume_async(*args, formats=text_only))
+    
+    assert result == expected
+    assert 'Backend engineer' in result['text_content']
+
+
+def test_pdf_bytes_only_returned_on_request(tmp_path, monkeypatch):
+    import json
+    import ai_resume_generator
+    
+    monkeypatch.setattr(ai_resume_generator, '_OUT_DIR', str(tmp_path))
+    generator = AIEnhancedResumeGenerator()
+    args = ("Jane Doe\njane@example.com\nPython engineer", {}, {}, {}, {})
+    
+    result = generator.generate_ai_optimized_resume(*args)
+    assert 'pdf_bytes' not in result
+    json.dumps(result)
+    
+    result = generator.generate_ai_optimized_resume(*args, include_bytes=True)
+    with open(result['pdf_path'], 'rb') as f:
+        assert result['pdf_bytes'] == f.read()
+
+
+def test_non_string_llm_items_are_rendered(tmp_path, monkeypatch):
+    import ai_resume_generator
+    
+    monkeypatch.setattr(ai_resume_generator, '_OUT_DIR', str(tmp_path))
+    generator = AIEnhancedResumeGenerator()
+    optimized = {'key_achievements': [{'a': 1}, 42], 'optimized_experience_bullets': [3.5]}
+    
+    result = generator.generate_ai_optimized_resume("Jane Doe", {}, {}, {}, optimized)
+    
+    assert "🏆 {'a': 1}" in result['text_content']
+    assert "🏆 42" in result['text_content']
+    assert "• 3.5" in result['text_content']
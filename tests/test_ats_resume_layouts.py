@@ -0,0 +1,87 @@
+import os
+
+import pytest
+
+import ats_resume_layouts
+from ats_resume_layouts import ATSResumeLayouts
+
+
+RESUME = {
+    'original_resume_text': "Jane Doe\njane@example.com\nExperience\nEngineer at AT&T\n- Built R&D tools",
+}
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(ATSResumeLayouts, '_OUTPUT_DIR_READY', False)
+    monkeypatch.setattr(ats_resume_layouts, '_CACHE_COUNT', None)
+    return tmp_path
+
+
+def test_regenerating_copies_from_cache(workdir):
+    generator = ATSResumeLayouts()
+    first = generator.generate_ats_resume(RESUME)
+    second = generator.generate_ats_resume(RESUME)
+    
+    assert first['pdf_path'] != second['pdf_path']
+    cached = os.listdir(workdir / 'uploads' / 'cache')
+    assert len(cached) == 1
+    
+    # Editing a served file must not touch the cache entry
+    with open(second['pdf_path'], 'wb') as f:
+        f.write(b'')
+    cache_file = workdir / 'uploads' / 'cache' / cached[0]
+    assert cache_file.read_bytes() == open(first['pdf_path'], 'rb').read()
+
+
+def test_cache_evicts_least_recently_used(workdir, monkeypatch):
+    monkeypatch.setattr(ats_resume_layouts, '_CACHE_MAX_ENTRIES', 4)
+    monkeypatch.setattr(ats_resume_layouts, '_CACHE_KEEP_ENTRIES', 3)
+    listings = []
+    scandir = os.scandir
+    monkeypatch.setattr(os, 'scandir', lambda path: listings.append(path) or scandir(path))
+    
+    generator = ATSResumeLayouts()
+    keys = []
+    for name in ('Ann', 'Bob', 'Cy', 'Dee', 'Eve'):
+        resume = {'original_resume_text': f"{name}\n" + RESUME['original_resume_text']}
+        keys.append(ats_resume_layouts._content_key(generator._process_resume_data(resume), 'modern_ats'))
+        generator.generate_ats_resume(resume)
+    
+    # One listing to count the cache, one to evict once it went over the cap
+    assert len(listings) == 2
+    assert sorted(os.listdir(workdir / 'uploads' / 'cache')) == sorted(f"{key}.pdf" for key in keys[2:])
+
+
+def test_generate_many_builds_identical_jobs_once(workdir, monkeypatch):
+    built = []
+    
+    class InlinePool:
+        def map(self, fn, items):
+            items = list(items)
+            built.extend(items)
+            return map(fn, items)
+    
+    monkeypatch.setattr(ats_resume_layouts, '_get_pdf_pool', InlinePool)
+    results = ATSResumeLayouts().generate_many([RESUME, RESUME, RESUME])
+    
+    assert len(built) == 1
+    contents = {open(result['pdf_path'], 'rb').read() for result in results}
+    assert len(results) == 3 and len(contents) == 1
+
+
+@pytest.mark.parametrize('layout', ['modern_ats', 'tech_focused', 'classic_professional'])
+def test_markup_characters_in_fields_are_escaped(layout):
+    text = (
+        "Jane Doe\njane@example.com\nExperience\nAT&T <Labs> | Dallas & Austin, TX | 2019 - 2023\n"
+        "- Built R&D tools <b>\nEducation\nB.Tech in R&D <Eng>, Texas A&M University 2018\n"
+    )
+    generator = ATSResumeLayouts()
+    data = generator._process_resume_data({'original_resume_text': text})
+    
+    story = getattr(generator, f'_build_{layout}_story')(data)
+    
+    rendered = [flowable.getPlainText() for flowable in story if hasattr(flowable, 'getPlainText')]
+    assert 'AT&T <Labs> | Dallas & Austin, TX | 2019 - 2023' in rendered
+    assert any(line.startswith('- Built R&D tools <b>') for line in rendered)
@@ -0,0 +1,36 @@
+import pytest
+
+import enhanced_analyzer
+from enhanced_analyzer import EnhancedResumeAnalyzer, get_analyzer
+
+
+def test_symbol_keywords_count_toward_industry():
+    analyzer = EnhancedResumeAnalyzer()
+    text = "Game programmer with five years writing C++ and C# gameplay code for console titles"
+    
+    assert analyzer.analyze_resume(text)['detected_industry'] == 'gaming'
+    assert analyzer.analyze_job_description(text)['industry'] == 'gaming'
+
+
+def test_symbol_keywords_still_need_to_appear():
+    analyzer = EnhancedResumeAnalyzer()
+    
+    assert analyzer._detect_industry("writing c and python services") != 'gaming'
+
+
+def test_analyze_many_rejects_unknown_kind():
+    with pytest.raises(ValueError):
+        get_analyzer().analyze_many(["text"], kind='cover_letter')
+
+
+def test_analyze_many_pool_shuts_down():
+    texts = [
+        "Python developer with 5 years of experience building Django and Flask services on AWS",
+        "Senior Java engineer with 8 years of experience leading Spring microservice teams",
+    ]
+    
+    results = get_analyzer().analyze_many(texts)
+    enhanced_analyzer._shutdown_analysis_pool()
+    
+    assert results == [get_analyzer().analyze_resume(text) for text in texts]
+    assert enhanced_analyzer._ANALYSIS_POOL is None